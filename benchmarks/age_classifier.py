@@ -0,0 +1,57 @@
+"""
+Benchmark: table-driven AgeClassifier against the original if/elif ladder
+Classifies the same random ages with the ladder, the bisect lookup and
+the vectorized classify_many
+
+Usage:
+    python -m benchmarks.age_classifier --size 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from models.controls_flow import AgeClassifier
+
+
+def ladder_classify(age: int) -> dict:
+    """The original if/elif implementation, kept here as the baseline"""
+    if age < 13:
+        return {"category": "Child", "emoji": "👶", "color": "success"}
+    elif age < 18:
+        return {"category": "Teenager", "emoji": "🧑", "color": "info"}
+    elif age < 65:
+        return {"category": "Adult", "emoji": "👨", "color": "warning"}
+    else:
+        return {"category": "Senior", "emoji": "👴", "color": "error"}
+
+
+def timed(label: str, func, size: int):
+    """Run func once and print its time and per-item cost"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed:8.3f} s   {elapsed / size * 1e9:8.1f} ns/age")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    ages_array = np.random.default_rng(args.seed).integers(0, 100, args.size)
+    ages = ages_array.tolist()
+    
+    ladder = timed("if/elif ladder", lambda: [ladder_classify(a)["category"] for a in ages], args.size)
+    table = timed("bisect table", lambda: [AgeClassifier.classify(a)["category"] for a in ages], args.size)
+    codes = timed("classify_many", lambda: AgeClassifier.classify_many(ages_array), args.size)
+    
+    names = [c["category"] for c in AgeClassifier.CATEGORIES]
+    assert ladder == table == [names[c] for c in codes.tolist()]
+
+
+if __name__ == "__main__":
+    main()
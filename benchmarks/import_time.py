@@ -0,0 +1,82 @@
+"""
+Benchmark: cold-start import time of each page entry point
+Runs the top-level imports of every page in a fresh interpreter with
+`python -X importtime` and reports the cumulative import time, so
+startup on new replicas can be tracked over time. Page bodies are not
+executed, so no widgets run and no files are created.
+
+Usage:
+    python -m benchmarks.import_time --repeat 5 --top 10
+"""
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENTRY_POINTS = ['main.py', *sorted(str(p.relative_to(ROOT)) for p in (ROOT / 'pages').glob('*.py'))]
+
+
+def import_statements(entry_point: str) -> str:
+    """Source of the module-level import statements of an entry point"""
+    path = ROOT / entry_point
+    tree = ast.parse(path.read_text(encoding='utf-8'), str(path))
+    return "\n".join(
+        ast.unparse(node) for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
+def measure(entry_point: str) -> dict:
+    """
+    Import-time profile of one entry point in a fresh interpreter
+    
+    Args:
+        entry_point: Script path relative to the repository root
+        
+    Returns:
+        Dictionary of top-level module -> cumulative import time (us)
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', import_statements(entry_point)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{entry_point} failed:\n{proc.stderr[-2000:]}")
+    
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package",
+        # nested imports are indented under the package that pulled them in
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        if not name[1:].startswith(' '):
+            cumulative[name.strip()] = int(cumulative_us)
+    
+    return cumulative
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('entry_points', nargs='*', default=ENTRY_POINTS)
+    parser.add_argument('--repeat', type=int, default=5, help="fresh interpreters per entry point")
+    parser.add_argument('--top', type=int, default=5, help="slowest top-level imports to list")
+    args = parser.parse_args()
+    
+    for entry_point in args.entry_points:
+        runs = [measure(entry_point) for _ in range(args.repeat)]
+        totals = [sum(run.values()) for run in runs]
+        print(f"{entry_point}: median {statistics.median(totals) / 1000:.1f} ms "
+              f"(min {min(totals) / 1000:.1f}, max {max(totals) / 1000:.1f}, n={len(totals)})")
+        
+        slowest = sorted(runs[-1].items(), key=lambda x: x[1], reverse=True)[:args.top]
+        for name, us in slowest:
+            print(f"    {name:<30} {us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: concurrent writers on the shared inventory
+Runs N writer threads against one SharedInventory and reports throughput
+
+Usage:
+    python -m benchmarks.inventory_concurrency --threads 1 2 4 8
+"""
+
+import argparse
+import threading
+import time
+
+from models.data_structures import SharedInventory, SQLiteInventory
+
+
+def run(threads: int, writes: int, products: int, persistent: bool) -> float:
+    """
+    Run one benchmark round
+    
+    Args:
+        threads: Number of writer threads
+        writes: Writes performed by each thread
+        products: Number of distinct products written to
+        persistent: Write through to an in-memory SQLite store
+        
+    Returns:
+        Writes per second
+    """
+    store = SQLiteInventory(':memory:') if persistent else None
+    inventory = SharedInventory(store=store)
+    start_barrier = threading.Barrier(threads + 1)
+    
+    def writer(worker: int) -> None:
+        start_barrier.wait()
+        for i in range(writes):
+            inventory[f"product-{(worker * 7919 + i) % products}"] = i % 100
+    
+    workers = [threading.Thread(target=writer, args=(w,)) for w in range(threads)]
+    for t in workers:
+        t.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    inventory.flush()
+    elapsed = time.perf_counter() - start
+    
+    assert inventory.total_items == sum(inventory.values())
+    if store is not None:
+        inventory.close()
+        assert store.total_items == inventory.total_items
+    return threads * writes / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--writes', type=int, default=50_000, help="writes per thread")
+    parser.add_argument('--products', type=int, default=10_000)
+    parser.add_argument('--persistent', action='store_true', help="write through to SQLite")
+    args = parser.parse_args()
+    
+    print(f"{'threads':>8} {'writes/s':>14}")
+    for threads in args.threads:
+        rate = run(threads, args.writes, args.products, args.persistent)
+        print(f"{threads:>8} {rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: ListComprehensions kernels in list, numpy and lazy modes
+Times every kernel over the same synthetic inputs in each mode (lazy
+results are consumed fully so all modes do the same work)
+
+Usage:
+    python -m benchmarks.list_comprehensions --size 10000000
+"""
+
+import argparse
+import time
+from collections import deque
+
+import numpy as np
+
+from models.data_structures import ListComprehensions
+
+
+def consume(result) -> None:
+    """Drain generators; arrays and lists are already materialized"""
+    if not isinstance(result, (list, np.ndarray)):
+        deque(result, maxlen=0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    readings = rng.uniform(-40, 50, args.size).tolist()
+    names = rng.choice(['Ana', 'Bruno', 'Carlos', 'Diana', ''], args.size).tolist()
+    
+    kernels = {
+        # int64 cubes overflow above 2_097_151
+        'generate_cubes': lambda mode: ListComprehensions.generate_cubes(min(args.size, 2_097_151), mode),
+        'filter_divisible_by_3': lambda mode: ListComprehensions.filter_divisible_by_3(args.size, mode),
+        'celsius_to_fahrenheit': lambda mode: ListComprehensions.celsius_to_fahrenheit(readings, mode),
+        'extract_initials': lambda mode: ListComprehensions.extract_initials(names, mode),
+    }
+    
+    print(f"{'kernel':<24}" + "".join(f"{mode:>10}" for mode in ListComprehensions.MODES))
+    for name, kernel in kernels.items():
+        row = f"{name:<24}"
+        for mode in ListComprehensions.MODES:
+            start = time.perf_counter()
+            consume(kernel(mode))
+            row += f"{time.perf_counter() - start:>9.3f}s"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: memory per sale row, dictionaries against SalesTable
+Builds the same synthetic sales as a list of dicts and as a SalesTable
+and reports traced memory per row
+
+Usage:
+    python -m benchmarks.sales_memory --size 10000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from models.data_structures import SalesAnalyzer, SalesTable
+
+PRODUCTS = ['Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headset', 'Webcam', 'Dock']
+
+
+def synthetic_sales(size: int):
+    """Yield deterministic synthetic sale dictionaries"""
+    for i in range(size):
+        yield {
+            'product': PRODUCTS[i % len(PRODUCTS)],
+            'price': float(10 + i % 990),
+            'quantity': 1 + i % 9
+        }
+
+
+def measure(label: str, build, size: int):
+    """Build a container under tracemalloc and print memory and analysis time"""
+    gc.collect()
+    tracemalloc.start()
+    container = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    analysis = SalesAnalyzer.analyze_sales(container)
+    elapsed = time.perf_counter() - start
+    
+    print(f"{label:<14} {current / 2**20:10.1f} MiB   {current / size:8.1f} B/row   "
+          f"analyze_sales {elapsed:7.3f} s")
+    return analysis
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10_000_000)
+    args = parser.parse_args()
+    
+    # Untimed warm-up, so neither measurement pays for lazy imports (numpy)
+    SalesAnalyzer.analyze_sales(SalesTable(synthetic_sales(10)))
+    SalesAnalyzer.analyze_sales(list(synthetic_sales(10)))
+    
+    table = measure("SalesTable", lambda: SalesTable(synthetic_sales(args.size)), args.size)
+    dicts = measure("list of dicts", lambda: list(synthetic_sales(args.size)), args.size)
+    
+    assert table['total_revenue'] == dicts['total_revenue']
+    assert table['total_products'] == dicts['total_products']
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: SalesAnalyzer.analyze_sales_parallel scaling with worker count
+Runs the partitioned analyzer on synthetic in-memory columns with 1, 2, 4
+and 8 worker processes and reports speedup against one worker
+
+Usage:
+    python -m benchmarks.sales_parallel --size 20000000 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from models.data_structures import SalesAnalyzer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=20_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    prices = rng.uniform(1, 2000, args.size)
+    quantities = rng.integers(1, 10, args.size)
+    expected = SalesAnalyzer.analyze_sales_columnar(prices[:1000], quantities[:1000])
+    
+    print(f"{'workers':>8} {'best (s)':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = SalesAnalyzer.analyze_sales_parallel((prices, quantities), workers=workers)
+            best = min(best, time.perf_counter() - start)
+        
+        assert result['sale_count'] == args.size
+        assert SalesAnalyzer.analyze_sales_parallel(
+            (prices[:1000], quantities[:1000]), workers=workers
+        )['total_products'] == expected['total_products']
+        
+        baseline = baseline or best
+        print(f"{workers:>8} {best:>10.3f} {baseline / best:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: IntSet and BitmapSet against built-in sets
+Reports memory and time of every perform_operations result for two
+overlapping integer ID sets at each size
+
+Usage:
+    python -m benchmarks.set_engines --sizes 1000000 10000000 100000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+
+from models.data_structures import BitmapSet, IntSet, SetOperations
+
+
+def build(label: str, factory, a, b) -> tuple:
+    """Build both sets under tracemalloc and print their memory"""
+    gc.collect()
+    tracemalloc.start()
+    set_a, set_b = factory(a), factory(b)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<10} memory {current / 2**20:10.1f} MiB")
+    return set_a, set_b
+
+
+def time_operations(set_a, set_b) -> None:
+    """Time each operation on its own, as a lazy caller would"""
+    results = SetOperations.perform_operations_lazy(set_a, set_b)
+    timings = []
+    for key in results:
+        start = time.perf_counter()
+        results[key]
+        timings.append(f"{key} {time.perf_counter() - start:.3f}s")
+    print("             " + ", ".join(timings))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--skip-builtin', action='store_true', help="skip built-in sets (slow and large at 1e8)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    for size in args.sizes:
+        # Dense IDs: two half-overlapping blocks with 10% of IDs missing
+        a = np.flatnonzero(rng.random(size + size // 9) < 0.9)[:size]
+        b = a + size // 2
+        print(f"size {size:,}")
+        
+        engines = [("IntSet", IntSet), ("BitmapSet", BitmapSet)]
+        if not args.skip_builtin:
+            engines.append(("set", lambda values: set(values.tolist())))
+        
+        for label, factory in engines:
+            set_a, set_b = build(label, factory, a, b)
+            time_operations(set_a, set_b)
+            del set_a, set_b
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark suite: every models hot path at 1e3, 1e5 and 1e7 elements
+Records best-of-N wall time and tracemalloc peak memory per case, stores
+baselines as JSON and exits with status 1 when a case regresses past
+the threshold. Runs offline with only the project dependencies.
+
+Usage:
+    python -m benchmarks.suite --save-baseline          # record baseline
+    python -m benchmarks.suite --threshold 0.25         # compare against it
+    python -m benchmarks.suite --sizes 1000 100000 -k Sales
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from models.cache import clear_caches
+from models.controls_flow import FizzBuzz, MultiplicationTable
+from models.data_structures import (
+    InventoryManager,
+    ListComprehensions,
+    SalesAnalyzer,
+    SetOperations,
+    WordAnalyzer
+)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+
+# Each timed run loops the call until it takes at least this long, so
+# sub-millisecond cases are not dominated by timer and scheduler noise
+MIN_RUN_SECONDS = 0.05
+
+# Differences below these are never reported as regressions
+MIN_DELTA = {'seconds': 0.001, 'peak_bytes': 64 * 1024}
+PRODUCTS = ['Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headset']
+NAMES = ['Ana', 'Bruno', 'Carlos', 'Diana', '']
+
+
+def inventory_operations(products: list) -> None:
+    """Add every product, then total and format the inventory"""
+    inventory = {}
+    for i, product in enumerate(products):
+        InventoryManager.add_product(inventory, product, i % 100)
+    InventoryManager.get_total_items(inventory)
+    InventoryManager.format_inventory(inventory)
+
+
+# name -> (setup(n) returning the arguments, function called with them)
+CASES = {
+    'SalesAnalyzer.analyze_sales': (
+        lambda n: ([{'product': PRODUCTS[i % 5], 'price': 10 + i % 990, 'quantity': 1 + i % 9}
+                    for i in range(n)],),
+        SalesAnalyzer.analyze_sales
+    ),
+    'WordAnalyzer.analyze': (
+        lambda n: ([f"word{i % 977}" for i in range(n)],),
+        WordAnalyzer.analyze
+    ),
+    'SetOperations.perform_operations': (
+        lambda n: (set(range(n)), set(range(n // 2, n + n // 2))),
+        SetOperations.perform_operations
+    ),
+    'ListComprehensions.generate_cubes': (
+        lambda n: (n,),
+        ListComprehensions.generate_cubes
+    ),
+    'ListComprehensions.filter_divisible_by_3': (
+        lambda n: (n,),
+        ListComprehensions.filter_divisible_by_3
+    ),
+    'ListComprehensions.celsius_to_fahrenheit': (
+        lambda n: ([i % 100 - 40 for i in range(n)],),
+        ListComprehensions.celsius_to_fahrenheit
+    ),
+    'ListComprehensions.extract_initials': (
+        lambda n: ([NAMES[i % 5] for i in range(n)],),
+        ListComprehensions.extract_initials
+    ),
+    'FizzBuzz.generate': (
+        lambda n: (n,),
+        FizzBuzz.generate
+    ),
+    'MultiplicationTable.generate': (
+        lambda n: (7, n),
+        MultiplicationTable.generate
+    ),
+    'InventoryManager.operations': (
+        lambda n: ([f"product-{i}" for i in range(n)],),
+        inventory_operations
+    ),
+}
+
+
+def measure(func, args: tuple, repeat: int) -> dict:
+    """
+    Time func(*args) and record its peak traced memory
+    
+    Args:
+        func: Function to benchmark
+        args: Arguments (built once, outside the measurement)
+        repeat: Timed runs; the best one is kept
+    
+    Returns:
+        Dictionary with 'seconds' (per call) and 'peak_bytes'
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        loops, elapsed = 0, 0.0
+        while elapsed < MIN_RUN_SECONDS:
+            clear_caches()
+            start = time.perf_counter()
+            func(*args)
+            elapsed += time.perf_counter() - start
+            loops += 1
+        best = min(best, elapsed / loops)
+    
+    # Separate run for memory: tracemalloc slows execution down
+    clear_caches()
+    gc.collect()
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {'seconds': best, 'peak_bytes': peak}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Find cases slower or hungrier than baseline by more than threshold
+    (and by more than MIN_DELTA in absolute terms)
+    
+    Returns:
+        List of human-readable regression messages
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            limit = max(base[metric] * (1 + threshold), base[metric] + MIN_DELTA[metric])
+            if base[metric] and result[metric] > limit:
+                change = result[metric] / base[metric] - 1
+                regressions.append(f"{key} {metric}: {base[metric]:.6g} -> {result[metric]:.6g} (+{change:.0%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 10_000_000])
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument('-k', dest='keyword', default='', help="only run cases whose name contains this")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="write results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed slowdown/growth (0.2 = 20%%)")
+    args = parser.parse_args()
+    
+    results = {}
+    print(f"{'case':<44} {'size':>10} {'time (s)':>10} {'peak (MiB)':>11}")
+    for name, (setup, func) in CASES.items():
+        if args.keyword not in name:
+            continue
+        for size in args.sizes:
+            call_args = setup(size)
+            result = measure(func, call_args, args.repeat)
+            del call_args
+            results[f"{name}@{size}"] = result
+            print(f"{name:<44} {size:>10,} {result['seconds']:>10.4f} {result['peak_bytes'] / 2**20:>11.2f}")
+    
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+    
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    print(f"\n{len(regressions)} regression(s) past {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
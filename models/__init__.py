@@ -2,17 +2,64 @@
 Models package
 Contains all business logic for Python Basics Recap app
 
+Exports are resolved lazily: a submodule is only imported the first time
+one of its names is accessed, so a page pays only for what it uses.
 """
 
-# Import all models
-from .python_basics import NumberOperations, StringOperations, ListOperations as BasicListOps
-from .controls_flow import AgeClassifier, MultiplicationTable, HealthCalculator, FizzBuzz, ControlFlowExamples
-from .data_structures import (
-    ListOperations,
-    DictionaryOperations,
-    InventoryManager,
-    ListComprehensions,
-    SetOperations,
-    SalesAnalyzer,
-    WordAnalyzer
-)
\ No newline at end of file
+import importlib
+
+# Public name -> (submodule, attribute in that submodule)
+_EXPORTS = {
+    # python_basics
+    'NumberOperations': ('python_basics', 'NumberOperations'),
+    'StringOperations': ('python_basics', 'StringOperations'),
+    'BasicListOps': ('python_basics', 'ListOperations'),
+    'SequenceView': ('python_basics', 'SequenceView'),
+    # controls_flow
+    'AgeClassifier': ('controls_flow', 'AgeClassifier'),
+    'MultiplicationTable': ('controls_flow', 'MultiplicationTable'),
+    'MultiplicationMatrix': ('controls_flow', 'MultiplicationMatrix'),
+    'HealthCalculator': ('controls_flow', 'HealthCalculator'),
+    'FizzBuzz': ('controls_flow', 'FizzBuzz'),
+    'ControlFlowExamples': ('controls_flow', 'ControlFlowExamples'),
+    # data_structures
+    'ListOperations': ('data_structures', 'ListOperations'),
+    'DictionaryOperations': ('data_structures', 'DictionaryOperations'),
+    'InventoryManager': ('data_structures', 'InventoryManager'),
+    'SQLiteInventory': ('data_structures', 'SQLiteInventory'),
+    'TrackedInventory': ('data_structures', 'TrackedInventory'),
+    'SharedInventory': ('data_structures', 'SharedInventory'),
+    'ListComprehensions': ('data_structures', 'ListComprehensions'),
+    'SetOperations': ('data_structures', 'SetOperations'),
+    'Deduplicator': ('data_structures', 'Deduplicator'),
+    'BloomFilter': ('data_structures', 'BloomFilter'),
+    'IntSet': ('data_structures', 'IntSet'),
+    'BitmapSet': ('data_structures', 'BitmapSet'),
+    'SalesAnalyzer': ('data_structures', 'SalesAnalyzer'),
+    'SalesTable': ('data_structures', 'SalesTable'),
+    'SaleRecord': ('data_structures', 'SaleRecord'),
+    'WordAnalyzer': ('data_structures', 'WordAnalyzer'),
+    'LetterCounter': ('data_structures', 'LetterCounter'),
+    # cache
+    'cached': ('cache', 'cached'),
+    'cache_stats': ('cache', 'cache_stats'),
+    'clear_caches': ('cache', 'clear_caches'),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access"""
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
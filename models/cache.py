@@ -0,0 +1,164 @@
+"""
+Model: Result Cache
+Bounded LRU cache for pure model methods, shared by every app session
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+
+# Every cache created by @cached, keyed by the wrapped method's qualified name
+_caches = {}
+
+
+class LRUCache:
+    """Thread-safe LRU cache with hit/miss counters"""
+    
+    def __init__(self, maxsize: int = 128):
+        """
+        Create an empty cache
+        
+        Args:
+            maxsize: Maximum number of entries kept (least recently used
+                     entries are evicted first)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, compute, max_items: int | None = None):
+        """
+        Return the cached value for key, computing it on a miss
+        
+        Args:
+            key: Hashable cache key
+            compute: Zero-argument callable producing the value
+            max_items: Values longer than this are returned but not stored,
+                       so one huge result cannot pin memory in the cache
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+        
+        value = compute()
+        if max_items is not None and _size(value) > max_items:
+            return value
+        
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+    
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._data),
+            'maxsize': self.maxsize
+        }
+
+
+def _size(value) -> int:
+    """Number of items in value (1 for scalars)"""
+    try:
+        return len(value)
+    except TypeError:
+        return 1
+
+
+def _freeze(value):
+    """
+    Turn (possibly unhashable) arguments into a hashable cache key
+    
+    Every value is tagged with its type, so 2 and 2.0 (or a set and a
+    frozenset) get separate entries, like lru_cache(typed=True).
+    """
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(value))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (type(value), tuple((k, _freeze(v)) for k, v in value.items()))
+    return (type(value), value)
+
+
+def _copy(value):
+    """
+    Copy the containers of a result (lists, dicts, sets), sharing the
+    elements; much cheaper than copy.deepcopy for plain data
+    """
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def cached(maxsize: int = 128, max_items: int = 10_000):
+    """
+    Cache a pure function's results, keyed on its arguments
+    
+    Lists, tuples, sets and dicts are accepted as arguments; calls with
+    other unhashable arguments bypass the cache. Every call gets its own
+    copy of the result's lists, dicts and sets (same types as the
+    undecorated function), so callers can mutate it without corrupting
+    the cache. The cache lives at module level, so it is shared by every
+    session in the Streamlit server process.
+    
+    Args:
+        maxsize: Maximum number of cached argument combinations
+        max_items: Results longer than this are not cached
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        cache = LRUCache(maxsize)
+        _caches[func.__qualname__] = cache
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (_freeze(args), _freeze(kwargs))
+            try:
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+            return _copy(cache.get(key, lambda: func(*args, **kwargs), max_items))
+        
+        wrapper.cache = cache
+        return wrapper
+    
+    return decorator
+
+
+def cache_stats() -> dict:
+    """Return hit/miss counters for every cached model method"""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def clear_caches() -> None:
+    """Empty every cache created by @cached"""
+    for cache in _caches.values():
+        cache.clear()
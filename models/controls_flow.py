@@ -3,11 +3,52 @@ Model: Control Flow Operations
 Contains business logic for Chapter 4 - conditionals, loops, functions
 """
 
+import bisect
+import json
+import os
+from collections.abc import Iterator
+from itertools import cycle
+from types import MappingProxyType
+
+from .cache import cached
+
+
 class AgeClassifier:
-    """Handle age classification logic"""
+    """Handle age classification logic
+    
+    Table-driven: THRESHOLDS holds the sorted lower bounds of every
+    category after the first, CATEGORIES holds one shared read-only
+    record per interval. Both can be replaced with load_config, or by
+    pointing the AGE_CLASSIFIER_CONFIG environment variable at a JSON
+    file, which is loaded on the first classification (not at import,
+    so a bad file cannot stop pages from loading).
+    """
+    
+    THRESHOLDS = (13, 18, 65)
+    CATEGORIES = (
+        MappingProxyType({"category": "Child", "emoji": "👶", "color": "success"}),
+        MappingProxyType({"category": "Teenager", "emoji": "🧑", "color": "info"}),
+        MappingProxyType({"category": "Adult", "emoji": "👨", "color": "warning"}),
+        MappingProxyType({"category": "Senior", "emoji": "👴", "color": "error"}),
+    )
+    
+    # Set once AGE_CLASSIFIER_CONFIG was applied or load_config was called
+    _configured = False
+    
+    @staticmethod
+    def _load_env_config() -> None:
+        """Apply the AGE_CLASSIFIER_CONFIG file, if any, on first use"""
+        path = os.environ.get('AGE_CLASSIFIER_CONFIG')
+        if not path:
+            AgeClassifier._configured = True
+            return
+        try:
+            AgeClassifier.load_config(path)
+        except (OSError, ValueError) as error:
+            raise ValueError(f"AGE_CLASSIFIER_CONFIG file {path!r} could not be loaded: {error}") from error
     
     @staticmethod
-    def classify(age: int) -> dict:
+    def classify(age: int) -> MappingProxyType:
         """
         Classify age into categories
         
@@ -15,16 +56,60 @@ class AgeClassifier:
             age: Age to classify
             
         Returns:
-            Dictionary with category and emoji (to choose the emoji: win + .)
+            Read-only mapping with category and emoji (to choose the emoji: win + .)
         """
-        if age < 13:
-            return {"category": "Child", "emoji": "👶", "color": "success"}
-        elif age < 18:
-            return {"category": "Teenager", "emoji": "🧑", "color": "info"}
-        elif age < 65:
-            return {"category": "Adult", "emoji": "👨", "color": "warning"}
-        else:
-            return {"category": "Senior", "emoji": "👴", "color": "error"}
+        if not AgeClassifier._configured:
+            AgeClassifier._load_env_config()
+        return AgeClassifier.CATEGORIES[bisect.bisect_right(AgeClassifier.THRESHOLDS, age)]
+    
+    @staticmethod
+    def classify_many(ages):
+        """
+        Classify many ages at once (vectorized with NumPy)
+        
+        Args:
+            ages: Array-like of ages
+            
+        Returns:
+            Int array of indexes into CATEGORIES
+        """
+        import numpy as np
+        
+        if not AgeClassifier._configured:
+            AgeClassifier._load_env_config()
+        return np.searchsorted(AgeClassifier.THRESHOLDS, ages, side='right').astype(np.int8)
+    
+    @staticmethod
+    def load_config(path: str) -> None:
+        """
+        Replace thresholds and categories from a JSON file
+        
+        The file holds {"thresholds": [...], "categories": [{...}, ...]},
+        with one more category than thresholds.
+        
+        Args:
+            path: Path to the JSON configuration file
+            
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not valid JSON or not a valid table
+        """
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+        
+        try:
+            thresholds = tuple(config['thresholds'])
+            categories = tuple(MappingProxyType(dict(c)) for c in config['categories'])
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"invalid age classifier config: {error!r}") from error
+        if list(thresholds) != sorted(thresholds):
+            raise ValueError("thresholds must be sorted")
+        if len(categories) != len(thresholds) + 1:
+            raise ValueError("there must be exactly one more category than thresholds")
+        
+        AgeClassifier.THRESHOLDS = thresholds
+        AgeClassifier.CATEGORIES = categories
+        AgeClassifier._configured = True
 
 
 class MultiplicationTable:
@@ -45,6 +130,7 @@ class MultiplicationTable:
         return [(i, number * i) for i in range(1, up_to + 1)]
     
     @staticmethod
+    @cached()
     def format_table(number: int, up_to: int = 10) -> list:
         """
         Generate formatted multiplication table strings
@@ -59,9 +145,97 @@ class MultiplicationTable:
         return [f"{number} × {i} = {number * i}" for i in range(1, up_to + 1)]
 
 
+class MultiplicationMatrix:
+    """Every multiplication table for a range of numbers at once
+    
+    Builds the whole N×M product matrix with one NumPy outer product and
+    hands out read-only views of it. Strings are only formatted for the
+    rows a caller actually asks for.
+    """
+    
+    def __init__(self, numbers: int = 10, up_to: int = 10):
+        """
+        Build the product matrix
+        
+        Args:
+            numbers: Largest base number (tables for 1..numbers)
+            up_to: Maximum multiplier
+        """
+        import numpy as np
+        
+        if numbers < 1 or up_to < 1:
+            raise ValueError("numbers and up_to must be positive")
+        self.numbers = numbers
+        self.up_to = up_to
+        self._values = np.multiply.outer(
+            np.arange(1, numbers + 1, dtype=np.int64),
+            np.arange(1, up_to + 1, dtype=np.int64)
+        )
+        self._values.setflags(write=False)
+    
+    @property
+    def values(self):
+        """Read-only (numbers × up_to) matrix, values[n - 1, i - 1] == n * i"""
+        return self._values
+    
+    def row(self, number: int):
+        """
+        Get one multiplication table without copying
+        
+        Args:
+            number: Base number (1..numbers)
+            
+        Returns:
+            Read-only array view of number × 1..up_to
+        """
+        if not 1 <= number <= self.numbers:
+            raise ValueError(f"number must be between 1 and {self.numbers}")
+        return self._values[number - 1]
+    
+    def generate(self, number: int, start: int = 1, stop: int = None) -> list:
+        """
+        Get part of a table as (multiplier, result) tuples
+        
+        Args:
+            number: Base number
+            start: First multiplier
+            stop: Last multiplier (default up_to)
+            
+        Returns:
+            List of tuples (multiplier, result), like MultiplicationTable.generate
+        """
+        start = max(start, 1)
+        stop = self.up_to if stop is None else min(stop, self.up_to)
+        results = self.row(number)[start - 1:stop].tolist()
+        return list(zip(range(start, stop + 1), results))
+    
+    def format_table(self, number: int, start: int = 1, stop: int = None) -> list:
+        """
+        Format only the requested rows of a table
+        
+        Args:
+            number: Base number
+            start: First multiplier to format
+            stop: Last multiplier to format (default up_to)
+            
+        Returns:
+            List of formatted strings, like MultiplicationTable.format_table
+        """
+        return [f"{number} × {i} = {result}" for i, result in self.generate(number, start, stop)]
+
+
 class HealthCalculator:
     """Calculate and classify health metrics"""
     
+    # BMI cut points and the category of each interval between them
+    BMI_CUTS = (18.5, 25, 30)
+    BMI_CATEGORIES = (
+        {"category": "Underweight", "color": "info"},
+        {"category": "Normal weight", "color": "success"},
+        {"category": "Overweight", "color": "warning"},
+        {"category": "Obesity", "color": "error"},
+    )
+    
     @staticmethod
     def calculate_bmi(weight: float, height: float) -> float:
         """
@@ -89,18 +263,74 @@ class HealthCalculator:
         Returns:
             Dictionary with category and color
         """
-        if bmi < 18.5:
-            return {"category": "Underweight", "color": "info"}
-        elif bmi < 25:
-            return {"category": "Normal weight", "color": "success"}
-        elif bmi < 30:
-            return {"category": "Overweight", "color": "warning"}
-        else:
-            return {"category": "Obesity", "color": "error"}
+        index = bisect.bisect_right(HealthCalculator.BMI_CUTS, bmi)
+        return dict(HealthCalculator.BMI_CATEGORIES[index])
+    
+    @staticmethod
+    def calculate_bmi_batch(weights, heights):
+        """
+        Calculate BMI for many people at once (vectorized with NumPy)
+        
+        Args:
+            weights: Array-like (or pandas Series) of weights in kg
+            heights: Array-like (or pandas Series) of heights in meters
+            
+        Returns:
+            Float array of BMI values, NaN where height is not positive
+        """
+        import numpy as np
+        
+        weights = np.asarray(weights, dtype=float)
+        heights = np.asarray(heights, dtype=float)
+        bmi = np.full(np.broadcast(weights, heights).shape, np.nan)
+        np.divide(weights, heights * heights, out=bmi, where=heights > 0)
+        return bmi
+    
+    @staticmethod
+    def classify_bmi_batch(bmis):
+        """
+        Classify many BMI values at once
+        
+        Args:
+            bmis: Array-like (or pandas Series) of BMI values
+            
+        Returns:
+            Int array of indexes into BMI_CATEGORIES, -1 where BMI is NaN
+        """
+        import numpy as np
+        
+        bmis = np.asarray(bmis, dtype=float)
+        codes = np.searchsorted(HealthCalculator.BMI_CUTS, bmis, side='right').astype(np.int8)
+        codes[np.isnan(bmis)] = -1
+        return codes
+    
+    @staticmethod
+    def category_names(codes):
+        """
+        Map category codes from classify_bmi_batch to category names
+        
+        Args:
+            codes: Int array returned by classify_bmi_batch
+            
+        Returns:
+            Object array of category names, None for invalid rows
+        """
+        import numpy as np
+        
+        names = np.array([c["category"] for c in HealthCalculator.BMI_CATEGORIES] + [None], dtype=object)
+        return names[np.asarray(codes)]
 
 
 class FizzBuzz:
-    """FizzBuzz game logic"""
+    """FizzBuzz game logic
+    
+    The pattern repeats every 15 numbers, so results come from a 15-slot
+    template indexed by number % 15; only the numeric slots (None) need
+    formatting.
+    """
+    
+    _TEMPLATE = ("FizzBuzz", None, None, "Fizz", None, "Buzz", "Fizz", None,
+                 None, "Fizz", "Buzz", None, "Fizz", None, None)
     
     @staticmethod
     def generate(up_to: int = 30) -> list:
@@ -113,17 +343,58 @@ class FizzBuzz:
         Returns:
             List of FizzBuzz results
         """
-        result = []
-        for i in range(1, up_to + 1):
-            if i % 3 == 0 and i % 5 == 0:
-                result.append("FizzBuzz")
-            elif i % 3 == 0:
-                result.append("Fizz")
-            elif i % 5 == 0:
-                result.append("Buzz")
-            else:
-                result.append(str(i))
-        return result
+        return list(FizzBuzz.stream(up_to))
+    
+    @staticmethod
+    def value(number: int) -> str:
+        """
+        Get the FizzBuzz result for a single number in O(1)
+        
+        Args:
+            number: Position in the sequence (starting at 1)
+            
+        Returns:
+            "Fizz", "Buzz", "FizzBuzz" or the number as a string
+        """
+        return FizzBuzz._TEMPLATE[number % 15] or str(number)
+    
+    @staticmethod
+    def iter_chunks(up_to: int = None, chunk_size: int = 15_000, start: int = 1) -> Iterator[list]:
+        """
+        Lazily generate the FizzBuzz sequence in chunks
+        
+        Args:
+            up_to: Maximum number (None for an endless stream)
+            chunk_size: Number of results per chunk
+            start: First number of the sequence
+            
+        Yields:
+            Lists of up to chunk_size FizzBuzz results
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        
+        while up_to is None or start <= up_to:
+            end = start + chunk_size if up_to is None else min(start + chunk_size, up_to + 1)
+            offset = start % 15
+            slots = cycle(FizzBuzz._TEMPLATE[offset:] + FizzBuzz._TEMPLATE[:offset])
+            yield [slot or str(i) for i, slot in zip(range(start, end), slots)]
+            start = end
+    
+    @staticmethod
+    def stream(up_to: int = None, chunk_size: int = 15_000) -> Iterator[str]:
+        """
+        Lazily generate the FizzBuzz sequence one result at a time
+        
+        Args:
+            up_to: Maximum number (None for an endless stream)
+            chunk_size: Number of results computed per step
+            
+        Yields:
+            FizzBuzz results
+        """
+        for chunk in FizzBuzz.iter_chunks(up_to, chunk_size):
+            yield from chunk
 
 
 class ControlFlowExamples:
@@ -164,6 +435,7 @@ class ControlFlowExamples:
         return numbers
     
     @staticmethod
+    @cached()
     def function_examples() -> dict:
         """Return function examples"""
         
@@ -3,6 +3,29 @@ Model: Data Structures Operations
 Contains business logic for Chapter 5 - lists, dicts, sets, tuples, comprehensions
 """
 
+import codecs
+import csv
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import queue
+import tempfile
+import threading
+from array import array
+from collections import Counter
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
+from itertools import count, islice
+from pathlib import Path
+
+from .cache import cached
+
+# Default marker for pop(), so None can be a caller-supplied default
+_MISSING = object()
+
+
 class ListOperations:
     """Advanced list operations"""
     
@@ -71,47 +94,667 @@ class InventoryManager:
             'oranges': 40
         }
     
+    @staticmethod
+    def create_persistent_inventory(path: str = 'inventory.db') -> 'SQLiteInventory':
+        """
+        Open a SQLite-backed inventory, seeded with the default products
+        the first time the file is created
+        
+        Args:
+            path: SQLite database file
+            
+        Returns:
+            Dict-like inventory usable with every InventoryManager method
+        """
+        inventory = SQLiteInventory(path)
+        if not inventory:
+            inventory.add_products(InventoryManager.create_default_inventory())
+        return inventory
+    
+    @staticmethod
+    def create_shared_inventory(path: str = 'inventory.db') -> 'SharedInventory':
+        """
+        Create a thread-safe inventory for sharing across sessions,
+        loaded from and written through to a SQLite file
+        
+        Args:
+            path: SQLite database file
+            
+        Returns:
+            Dict-like inventory usable with every InventoryManager method
+        """
+        return SharedInventory(store=InventoryManager.create_persistent_inventory(path))
+    
     @staticmethod
     def add_product(inventory: dict, product: str, quantity: int) -> dict:
         """Add or update product in inventory"""
         inventory[product] = quantity
         return inventory
     
+    @staticmethod
+    def remove_product(inventory: dict, product: str) -> dict:
+        """Remove product from inventory (no-op if missing)"""
+        inventory.pop(product, None)
+        return inventory
+    
     @staticmethod
     def get_total_items(inventory: dict) -> int:
         """Calculate total items in inventory"""
+        if isinstance(inventory, (SQLiteInventory, TrackedInventory, SharedInventory)):
+            return inventory.total_items
         return sum(inventory.values())
     
     @staticmethod
     def format_inventory(inventory: dict) -> list:
         """Format inventory for display"""
         return [f"{product}: {qty} units" for product, qty in inventory.items()]
+    
+    @staticmethod
+    def update_formatted(lines: dict, changes: list) -> dict:
+        """
+        Apply change-log entries to previously formatted inventory lines
+        
+        Args:
+            lines: Dict of product -> formatted line (updated in place)
+            changes: Tuples (operation, product, quantity) from
+                     changes_since() of a TrackedInventory/SharedInventory
+            
+        Returns:
+            The updated lines, in insertion order like format_inventory
+        """
+        for op, product, quantity in changes:
+            if op == 'remove':
+                lines.pop(product, None)
+            else:
+                lines[product] = f"{product}: {quantity} units"
+        return lines
+
+
+class SQLiteInventory(MutableMapping):
+    """Persistent inventory stored in a local SQLite file
+    
+    Behaves like the plain inventory dict (product -> quantity), so the
+    InventoryManager static methods work on it unchanged. Product names
+    are the indexed primary key and the total quantity is kept up to
+    date by triggers, so reading it is O(1).
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS products (
+            name TEXT PRIMARY KEY,
+            quantity INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS totals (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            total_items INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO totals (id, total_items) VALUES (0, 0);
+        CREATE TRIGGER IF NOT EXISTS products_insert AFTER INSERT ON products
+        BEGIN
+            UPDATE totals SET total_items = total_items + NEW.quantity WHERE id = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS products_update AFTER UPDATE OF quantity ON products
+        BEGIN
+            UPDATE totals SET total_items = total_items - OLD.quantity + NEW.quantity WHERE id = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS products_delete AFTER DELETE ON products
+        BEGIN
+            UPDATE totals SET total_items = total_items - OLD.quantity WHERE id = 0;
+        END;
+    """
+    
+    _UPSERT = """
+        INSERT INTO products (name, quantity) VALUES (?, ?)
+        ON CONFLICT (name) DO UPDATE SET quantity = excluded.quantity
+    """
+    
+    def __init__(self, path: str = 'inventory.db'):
+        """
+        Open (or create) the inventory database
+        
+        The connection may be shared between threads (Streamlit sessions,
+        SharedInventory writers); every use of it is serialised by a lock,
+        so one thread cannot commit or roll back another's transaction.
+        
+        Args:
+            path: SQLite database file (':memory:' for a throwaway store)
+        """
+        import sqlite3
+        
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(self._SCHEMA)
+    
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        """Run a read-only query under the connection lock"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+    
+    def __getitem__(self, product: str) -> int:
+        rows = self._query("SELECT quantity FROM products WHERE name = ?", (product,))
+        if not rows:
+            raise KeyError(product)
+        return rows[0][0]
+    
+    def __setitem__(self, product: str, quantity: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(self._UPSERT, (product, quantity))
+    
+    def __delitem__(self, product: str) -> None:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM products WHERE name = ?", (product,))
+        if cursor.rowcount == 0:
+            raise KeyError(product)
+    
+    # pop/popitem/setdefault are overridden so the read and the write
+    # happen under one lock (the MutableMapping versions are two steps)
+    
+    def pop(self, product: str, default=_MISSING):
+        """Remove product and return its quantity (default if missing)"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT quantity FROM products WHERE name = ?", (product,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM products WHERE name = ?", (product,))
+        if row is None:
+            if default is _MISSING:
+                raise KeyError(product)
+            return default
+        return row[0]
+    
+    def popitem(self) -> tuple:
+        """Remove and return the oldest (product, quantity) pair"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT name, quantity FROM products ORDER BY rowid LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM products WHERE name = ?", (row[0],))
+        if row is None:
+            raise KeyError('popitem(): inventory is empty')
+        return row
+    
+    def setdefault(self, product: str, default: int = 0) -> int:
+        """Return product's quantity, adding it with default if missing"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO products (name, quantity) VALUES (?, ?)", (product, default)
+            )
+            return self._conn.execute(
+                "SELECT quantity FROM products WHERE name = ?", (product,)
+            ).fetchone()[0]
+    
+    def __iter__(self) -> Iterator[str]:
+        for (name,) in self._query("SELECT name FROM products ORDER BY rowid"):
+            yield name
+    
+    def __len__(self) -> int:
+        return self._query("SELECT COUNT(*) FROM products")[0][0]
+    
+    def items(self) -> list:
+        """Return (product, quantity) pairs with a single query"""
+        return self._query("SELECT name, quantity FROM products ORDER BY rowid")
+    
+    @property
+    def total_items(self) -> int:
+        """Total quantity of all products (maintained by triggers)"""
+        return self._query("SELECT total_items FROM totals WHERE id = 0")[0][0]
+    
+    def add_products(self, products) -> None:
+        """
+        Add or update many products in a single transaction
+        
+        Args:
+            products: Dict of product -> quantity, or iterable of pairs
+        """
+        if isinstance(products, dict):
+            products = products.items()
+        with self._lock, self._conn:
+            self._conn.executemany(self._UPSERT, products)
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class TrackedInventory(MutableMapping):
+    """In-memory inventory with running aggregates and a change log
+    
+    Behaves like the plain inventory dict, but keeps the total quantity,
+    the number of distinct products and the min/max stock up to date on
+    every mutation, and records each mutation in an append-only log so
+    a view can render only what changed since it last looked.
+    """
+    
+    def __init__(self, products: dict = None, log: list = None):
+        """
+        Create the inventory
+        
+        Args:
+            products: Initial dict of product -> quantity
+            log: List to append changes to (default: a new one); lets
+                 several inventories share one ordered log
+        """
+        self._items = {}
+        self._levels = Counter()  # quantity -> number of products at that level
+        self._min_heap = []
+        self._max_heap = []
+        self._log = [] if log is None else log
+        self.total_items = 0
+        if products:
+            self.update(products)
+    
+    def __getitem__(self, product: str) -> int:
+        return self._items[product]
+    
+    def __setitem__(self, product: str, quantity: int) -> None:
+        if product in self._items:
+            self._drop_level(self._items[product])
+            op = 'update'
+        else:
+            op = 'add'
+        self._items[product] = quantity
+        self.total_items += quantity
+        self._levels[quantity] += 1
+        heapq.heappush(self._min_heap, quantity)
+        heapq.heappush(self._max_heap, -quantity)
+        if len(self._min_heap) > 2 * len(self._levels) + 64:
+            # Too many stale entries: rebuild both heaps from live levels
+            self._min_heap = list(self._levels)
+            self._max_heap = [-q for q in self._levels]
+            heapq.heapify(self._min_heap)
+            heapq.heapify(self._max_heap)
+        self._log.append((op, product, quantity))
+    
+    def __delitem__(self, product: str) -> None:
+        quantity = self._items.pop(product)
+        self._drop_level(quantity)
+        self._log.append(('remove', product, quantity))
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def items(self) -> list:
+        """Return a snapshot of (product, quantity) pairs"""
+        return list(self._items.items())
+    
+    def _drop_level(self, quantity: int) -> None:
+        """Forget one product at this stock level"""
+        self.total_items -= quantity
+        self._levels[quantity] -= 1
+        if not self._levels[quantity]:
+            del self._levels[quantity]
+    
+    @property
+    def distinct_products(self) -> int:
+        """Number of distinct products"""
+        return len(self._items)
+    
+    @property
+    def min_stock(self) -> int:
+        """Lowest stock level, or None if empty"""
+        # Lazily discard heap entries whose level no longer exists
+        while self._min_heap and self._min_heap[0] not in self._levels:
+            heapq.heappop(self._min_heap)
+        return self._min_heap[0] if self._min_heap else None
+    
+    @property
+    def max_stock(self) -> int:
+        """Highest stock level, or None if empty"""
+        while self._max_heap and -self._max_heap[0] not in self._levels:
+            heapq.heappop(self._max_heap)
+        return -self._max_heap[0] if self._max_heap else None
+    
+    @property
+    def version(self) -> int:
+        """Number of changes recorded so far"""
+        return len(self._log)
+    
+    def changes_since(self, version: int = 0) -> list:
+        """
+        Get the changes made after a given version
+        
+        Args:
+            version: Value of `version` when the caller last looked
+            
+        Returns:
+            List of tuples (operation, product, quantity)
+        """
+        return self._log[version:]
+    
+    def get_summary(self) -> dict:
+        """Return all running aggregates"""
+        return {
+            'total_items': self.total_items,
+            'distinct_products': self.distinct_products,
+            'min_stock': self.min_stock,
+            'max_stock': self.max_stock
+        }
+
+
+class SharedInventory(MutableMapping):
+    """Thread-safe inventory meant to be shared by every app session
+    
+    Products are spread over lock-striped partitions, so writers to
+    different products rarely contend. Each partition is a
+    TrackedInventory, and all of them append to one change log, so the
+    total, distinct count, min/max stock and changes_since are as cheap
+    as on TrackedInventory. Readers of single products, totals and the
+    log take no locks and never wait for a write.
+    An optional backing store (e.g. SQLiteInventory) is loaded at start
+    and kept up to date by a single background writer, which batches
+    queued changes into one store write; call flush() to wait for it.
+    """
+    
+    def __init__(self, products: dict = None, store: MutableMapping = None,
+                 stripes: int = 16):
+        """
+        Create the shared inventory
+        
+        Args:
+            products: Initial dict of product -> quantity
+            store: Optional persistent mapping to load from and write to
+            stripes: Number of lock-protected partitions
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be positive")
+        # list.append is atomic, so partitions can share the log without
+        # another lock; each product's changes are logged under its stripe lock
+        self._log = []
+        self._parts = [TrackedInventory(log=self._log) for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._store = None
+        self._writer = None
+        self._error = None
+        
+        if store is not None:
+            self.add_products(store.items())
+            self._store = store
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._write_through, daemon=True)
+            self._writer.start()
+        if products:
+            self.add_products(products)
+    
+    def _stripe(self, product: str) -> int:
+        return hash(product) % len(self._parts)
+    
+    def __getitem__(self, product: str) -> int:
+        return self._parts[self._stripe(product)][product]
+    
+    def __setitem__(self, product: str, quantity: int) -> None:
+        self.add_products({product: quantity})
+    
+    def __delitem__(self, product: str) -> None:
+        self.pop(product)
+    
+    # pop/popitem/setdefault are overridden so the read and the write
+    # happen under one stripe lock (the MutableMapping versions are two steps)
+    
+    def pop(self, product: str, default=_MISSING):
+        """Remove product and return its quantity (default if missing)"""
+        i = self._stripe(product)
+        with self._locks[i]:
+            part = self._parts[i]
+            if product not in part:
+                if default is _MISSING:
+                    raise KeyError(product)
+                return default
+            quantity = part.pop(product)
+            if self._writer is not None:
+                self._queue.put([(product, None)])
+        return quantity
+    
+    def popitem(self) -> tuple:
+        """Remove and return some (product, quantity) pair"""
+        for i, part in enumerate(self._parts):
+            with self._locks[i]:
+                if not part:
+                    continue
+                product, quantity = part.popitem()
+                if self._writer is not None:
+                    self._queue.put([(product, None)])
+            return product, quantity
+        raise KeyError('popitem(): inventory is empty')
+    
+    def setdefault(self, product: str, default: int = 0) -> int:
+        """Return product's quantity, adding it with default if missing"""
+        i = self._stripe(product)
+        with self._locks[i]:
+            part = self._parts[i]
+            if product in part:
+                return part[product]
+            part[product] = default
+            if self._writer is not None:
+                self._queue.put([(product, default)])
+        return default
+    
+    def __iter__(self) -> Iterator[str]:
+        for part in self._parts:
+            yield from list(part)
+    
+    def __len__(self) -> int:
+        return sum(len(part) for part in self._parts)
+    
+    def items(self) -> list:
+        """Return a snapshot of (product, quantity) pairs"""
+        return [pair for part in self._parts for pair in part.items()]
+    
+    @property
+    def total_items(self) -> int:
+        """Total quantity of all products"""
+        return sum(part.total_items for part in self._parts)
+    
+    @property
+    def distinct_products(self) -> int:
+        """Number of distinct products"""
+        return len(self)
+    
+    @property
+    def min_stock(self) -> int:
+        """Lowest stock level, or None if empty"""
+        levels = []
+        for lock, part in zip(self._locks, self._parts):
+            with lock:  # min_stock trims the partition's heap
+                levels.append(part.min_stock)
+        levels = [level for level in levels if level is not None]
+        return min(levels) if levels else None
+    
+    @property
+    def max_stock(self) -> int:
+        """Highest stock level, or None if empty"""
+        levels = []
+        for lock, part in zip(self._locks, self._parts):
+            with lock:
+                levels.append(part.max_stock)
+        levels = [level for level in levels if level is not None]
+        return max(levels) if levels else None
+    
+    @property
+    def version(self) -> int:
+        """Number of changes recorded so far"""
+        return len(self._log)
+    
+    def changes_since(self, version: int = 0) -> list:
+        """
+        Get the changes made after a given version
+        
+        Args:
+            version: Value of `version` when the caller last looked
+            
+        Returns:
+            List of tuples (operation, product, quantity)
+        """
+        return self._log[version:]
+    
+    def get_summary(self) -> dict:
+        """Return all running aggregates"""
+        return {
+            'total_items': self.total_items,
+            'distinct_products': self.distinct_products,
+            'min_stock': self.min_stock,
+            'max_stock': self.max_stock
+        }
+    
+    def add_products(self, products) -> None:
+        """
+        Add or update many products, locking each partition once
+        
+        Args:
+            products: Dict of product -> quantity, or iterable of pairs
+        """
+        if isinstance(products, dict):
+            products = products.items()
+        
+        groups = {}
+        for product, quantity in products:
+            groups.setdefault(self._stripe(product), []).append((product, quantity))
+        
+        for i, group in groups.items():
+            part = self._parts[i]
+            with self._locks[i]:
+                for product, quantity in group:
+                    part[product] = quantity
+                # Queued under the stripe lock, so the store sees each
+                # product's changes in the order they were made
+                if self._writer is not None:
+                    self._queue.put(group)
+    
+    def _write_through(self) -> None:
+        """Writer thread: drain the queue and apply it to the store in batches"""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Last change per product wins; None marks a deletion
+            changes = {}
+            for group in batch:
+                if group is not None:
+                    changes.update(group)
+            try:
+                upserts = [(p, q) for p, q in changes.items() if q is not None]
+                if upserts:
+                    if isinstance(self._store, SQLiteInventory):
+                        self._store.add_products(upserts)
+                    else:
+                        self._store.update(upserts)
+                for product, quantity in changes.items():
+                    if quantity is None:
+                        self._store.pop(product, None)
+            except Exception as error:
+                self._error = error
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if None in batch:
+                return
+    
+    def flush(self) -> None:
+        """
+        Wait until every change so far has reached the backing store
+        
+        Raises:
+            Exception: The last error raised while writing to the store
+        """
+        if self._writer is None:
+            return
+        self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+    
+    def close(self) -> None:
+        """Flush pending changes and stop the writer thread"""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
 
 
 class ListComprehensions:
-    """List comprehension examples and operations"""
+    """List comprehension examples and operations
+    
+    Every kernel takes a `mode`: 'list' (default, a list comprehension),
+    'numpy' (a NumPy array, vectorized) or 'lazy' (a generator, for
+    unbounded streams).
+    """
+    
+    MODES = ('list', 'numpy', 'lazy')
+    
+    @staticmethod
+    def _check_mode(mode: str) -> None:
+        if mode not in ListComprehensions.MODES:
+            raise ValueError(f"mode must be one of {ListComprehensions.MODES}")
     
     @staticmethod
-    def generate_cubes(up_to: int = 10) -> list:
-        """Generate list of cubes"""
+    def generate_cubes(up_to: int = 10, mode: str = 'list'):
+        """Generate list of cubes (up_to=None with mode='lazy' never stops)"""
+        ListComprehensions._check_mode(mode)
+        if mode == 'numpy':
+            import numpy as np
+            if up_to > 2_097_151:  # 2_097_152 ** 3 == 2 ** 63
+                raise OverflowError("cubes above 2_097_151 do not fit in int64")
+            return np.arange(1, up_to + 1, dtype=np.int64) ** 3
+        if mode == 'lazy':
+            numbers = count(1) if up_to is None else range(1, up_to + 1)
+            return (x**3 for x in numbers)
         return [x**3 for x in range(1, up_to + 1)]
     
     @staticmethod
-    def filter_divisible_by_3(up_to: int = 30) -> list:
-        """Filter numbers divisible by 3"""
+    def filter_divisible_by_3(up_to: int = 30, mode: str = 'list'):
+        """Filter numbers divisible by 3 (up_to=None with mode='lazy' never stops)"""
+        ListComprehensions._check_mode(mode)
+        if mode == 'numpy':
+            import numpy as np
+            return np.arange(3, up_to + 1, 3)
+        if mode == 'lazy':
+            return count(3, 3) if up_to is None else iter(range(3, up_to + 1, 3))
         return [x for x in range(1, up_to + 1) if x % 3 == 0]
     
     @staticmethod
-    def celsius_to_fahrenheit(celsius_list: list) -> list:
-        """Convert Celsius to Fahrenheit"""
+    def celsius_to_fahrenheit(celsius_list, mode: str = 'list'):
+        """Convert Celsius to Fahrenheit (any iterable with mode='lazy')"""
+        ListComprehensions._check_mode(mode)
+        if mode == 'numpy':
+            import numpy as np
+            fahrenheit = np.array(celsius_list, dtype=np.float64)
+            fahrenheit *= 1.8  # in place: no temporaries
+            fahrenheit += 32
+            return fahrenheit
+        if mode == 'lazy':
+            return ((c * 9/5) + 32 for c in celsius_list)
         return [(c * 9/5) + 32 for c in celsius_list]
     
     @staticmethod
-    def extract_initials(names: list) -> list:
-        """Extract first letter from each name"""
+    def extract_initials(names, mode: str = 'list'):
+        """Extract first letter from each name (any iterable with mode='lazy')"""
+        ListComprehensions._check_mode(mode)
+        if mode == 'numpy':
+            import numpy as np
+            names = np.asarray(names, dtype=str)
+            return names[np.strings.str_len(names) > 0].astype('U1')
+        if mode == 'lazy':
+            return (name[0] for name in names if name)
         return [name[0] for name in names if name]
     
     @staticmethod
+    @cached()
     def get_all_examples() -> dict:
         """Get all comprehension examples"""
         celsius = [0, 10, 20, 30, 40]
@@ -158,103 +801,1357 @@ class SetOperations:
         }
     
     @staticmethod
-    def remove_duplicates(items: list) -> list:
-        """Remove duplicates from list using set"""
-        return list(set(items))
-
-
-class SalesAnalyzer:
-    """Analyze sales data"""
+    def perform_operations_lazy(set_a, set_b) -> 'LazySetOperations':
+        """
+        Set operations computed only when a result is read
+        
+        Args:
+            set_a: First set (built-in set, IntSet or BitmapSet)
+            set_b: Second set (same kind)
+            
+        Returns:
+            Mapping with the same keys as perform_operations
+        """
+        return LazySetOperations(set_a, set_b)
     
     @staticmethod
-    def get_sample_sales() -> list:
-        """Return sample sales data"""
-        return [
-            {'product': 'Laptop', 'price': 1200, 'quantity': 2},
-            {'product': 'Mouse', 'price': 25, 'quantity': 5},
-            {'product': 'Keyboard', 'price': 75, 'quantity': 3},
-        ]
+    def compact_set(values) -> 'IntSet | BitmapSet':
+        """
+        Build the most compact integer set for the given values
+        
+        A BitmapSet (1 bit per value in the range) is used when the values
+        are dense enough to beat an IntSet (8 bytes per value).
+        
+        Args:
+            values: Iterable or array of integers
+            
+        Returns:
+            IntSet or BitmapSet
+        """
+        int_set = IntSet(values)
+        if len(int_set) and (int_set.max() - int_set.min() + 1) < 64 * len(int_set):
+            return BitmapSet(int_set)
+        return int_set
     
     @staticmethod
-    def calculate_sale_total(sale: dict) -> float:
-        """Calculate total for a single sale"""
-        return sale['price'] * sale['quantity']
+    def remove_duplicates(items: list) -> list:
+        """Remove duplicates from list using set"""
+        return list(set(items))
     
     @staticmethod
-    def analyze_sales(sales: list) -> dict:
+    def deduplicate(items, mode: str = 'exact', **options):
         """
-        Analyze all sales data
+        Remove duplicates while keeping first-seen order
         
         Args:
-            sales: List of sale dictionaries
+            items: Iterable of hashable items (an integer array for 'numpy')
+            mode: 'exact' (set, spilling to disk past max_items),
+                  'bloom' (approximate, bounded memory) or 'numpy'
+                  (np.unique over an in-memory integer array)
+            **options: Passed to Deduplicator (max_items, spill_path,
+                       capacity, error_rate)
             
         Returns:
-            Analysis results
+            Iterator of unique items ('numpy' mode: a NumPy array)
         """
-        totals = [SalesAnalyzer.calculate_sale_total(s) for s in sales]
-        
-        return {
-            'individual_totals': totals,
-            'total_revenue': sum(totals),
-            'total_products': sum([s['quantity'] for s in sales]),
-            'average_sale': sum(totals) / len(totals) if totals else 0
-        }
-
-
-class WordAnalyzer:
-    """Analyze words and letter frequency"""
+        if mode == 'numpy':
+            return SetOperations.unique_array(items)
+        return Deduplicator(mode, **options).filter(items)
     
     @staticmethod
-    def count_letters(words: list) -> dict:
+    def unique_array(values):
         """
-        Count letter frequency in words
+        Order-preserving unique values of an integer array
         
         Args:
-            words: List of words to analyze
+            values: Array-like of integers
             
         Returns:
-            Dictionary with letter counts
+            NumPy array of unique values in order of first appearance
         """
-        text = ''.join(words).lower()
-        count = {}
-        
-        for letter in text:
-            count[letter] = count.get(letter, 0) + 1
+        import numpy as np
         
-        return count
+        values = np.asarray(values)
+        _, first_index = np.unique(values, return_index=True)
+        return values[np.sort(first_index)]
+
+
+class LazySetOperations(Mapping):
+    """Mapping of set operation results, each computed on first access"""
     
-    @staticmethod
-    def get_top_letters(words: list, top_n: int = 5) -> list:
+    _OPERATIONS = {
+        'union': lambda a, b: a | b,
+        'intersection': lambda a, b: a & b,
+        'difference_a_b': lambda a, b: a - b,
+        'difference_b_a': lambda a, b: b - a,
+        'symmetric_difference': lambda a, b: a ^ b,
+    }
+    
+    def __init__(self, set_a, set_b):
+        self._a = set_a
+        self._b = set_b
+        self._results = {}
+    
+    def __getitem__(self, key: str):
+        if key not in self._results:
+            self._results[key] = self._OPERATIONS[key](self._a, self._b)
+        return self._results[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._OPERATIONS)
+    
+    def __len__(self) -> int:
+        return len(self._OPERATIONS)
+
+
+class IntSet:
+    """Compact integer set backed by a sorted, unique int64 NumPy array
+    
+    Supports the built-in set operators (|, &, -, ^), `in`, len() and
+    iteration, at 8 bytes per element.
+    """
+    
+    def __init__(self, values=()):
         """
-        Get most common letters
+        Build the set
         
         Args:
-            words: List of words
-            top_n: Number of top letters to return
-            
-        Returns:
-            List of tuples (letter, count)
+            values: Iterable or array of integers (or another IntSet/BitmapSet)
         """
-        count = WordAnalyzer.count_letters(words)
-        sorted_letters = sorted(count.items(), key=lambda x: x[1], reverse=True)
-        return sorted_letters[:top_n]
+        import numpy as np
+        
+        if isinstance(values, (IntSet, BitmapSet)):
+            self._values = values.to_array()
+        elif isinstance(values, (set, frozenset)):
+            self._values = np.sort(np.fromiter(values, dtype=np.int64, count=len(values)))
+        elif hasattr(values, '__array__') or isinstance(values, Sequence):
+            self._values = IntSet._sort_unique(np.asarray(values, dtype=np.int64).ravel())
+        else:
+            # Generators, iterators, dict views...
+            self._values = IntSet._sort_unique(np.fromiter(values, dtype=np.int64))
     
     @staticmethod
-    def analyze(words: list) -> dict:
+    def _sort_unique(values):
+        """Sort and drop repeats (cheaper than np.unique for plain int arrays)"""
+        import numpy as np
+        
+        values = np.sort(values)
+        if values.size < 2:
+            return values
+        keep = np.empty(values.size, dtype=bool)
+        keep[0] = True
+        np.not_equal(values[1:], values[:-1], out=keep[1:])
+        return values[keep]
+    
+    @classmethod
+    def _from_sorted(cls, values) -> 'IntSet':
+        """Wrap an already sorted, unique array without copying"""
+        result = cls.__new__(cls)
+        result._values = values
+        return result
+    
+    @staticmethod
+    def _coerce(other):
+        return other._values if isinstance(other, IntSet) else IntSet(other)._values
+    
+    def __or__(self, other) -> 'IntSet':
+        import numpy as np
+        return IntSet._from_sorted(IntSet._sort_unique(np.concatenate([self._values, IntSet._coerce(other)])))
+    
+    def __and__(self, other) -> 'IntSet':
+        import numpy as np
+        return IntSet._from_sorted(np.intersect1d(self._values, IntSet._coerce(other), assume_unique=True))
+    
+    def __sub__(self, other) -> 'IntSet':
+        import numpy as np
+        return IntSet._from_sorted(np.setdiff1d(self._values, IntSet._coerce(other), assume_unique=True))
+    
+    def __xor__(self, other) -> 'IntSet':
+        import numpy as np
+        return IntSet._from_sorted(np.setxor1d(self._values, IntSet._coerce(other), assume_unique=True))
+    
+    def __contains__(self, value) -> bool:
+        i = self._values.searchsorted(value)
+        return i < self._values.size and self._values[i] == value
+    
+    def __len__(self) -> int:
+        return self._values.size
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values.tolist())
+    
+    def __eq__(self, other) -> bool:
+        import numpy as np
+        if isinstance(other, (IntSet, BitmapSet, set, frozenset)):
+            return np.array_equal(self._values, IntSet._coerce(other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        preview = ', '.join(map(str, self._values[:10].tolist()))
+        return f"IntSet({{{preview}{', ...' if len(self) > 10 else ''}}}, size={len(self)})"
+    
+    def min(self) -> int:
+        """Smallest element"""
+        return self._values[0].item()
+    
+    def max(self) -> int:
+        """Largest element"""
+        return self._values[-1].item()
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the elements"""
+        return self._values.nbytes
+    
+    def to_array(self):
+        """Sorted int64 array of the elements (read-only view)"""
+        view = self._values.view()
+        view.setflags(write=False)
+        return view
+    
+    def to_set(self) -> set:
+        """Convert to a built-in set"""
+        return set(self._values.tolist())
+
+
+class BitmapSet:
+    """Integer set stored as a bitmap over its value range
+    
+    One bit per possible value between the smallest and largest element,
+    which is far smaller than an IntSet for dense ID ranges. Supports
+    the same operators as IntSet.
+    """
+    
+    def __init__(self, values=()):
         """
-        Complete word analysis
+        Build the bitmap
         
         Args:
-            words: List of words
-            
-        Returns:
-            Complete analysis dictionary
+            values: Iterable or array of integers (or an IntSet/BitmapSet)
         """
-        text = ''.join(words)
+        import numpy as np
         
-        return {
-            'total_letters': len(text),
-            'unique_letters': len(set(text.lower())),
-            'letter_count': WordAnalyzer.count_letters(words),
-            'top_5': WordAnalyzer.get_top_letters(words, 5)
-        }
\ No newline at end of file
+        if isinstance(values, BitmapSet):
+            self._low, self._bits = values._low, values._bits.copy()
+            return
+        
+        array = values.to_array() if isinstance(values, IntSet) else IntSet(values).to_array()
+        if array.size == 0:
+            self._low, self._bits = 0, np.zeros(0, dtype=np.uint8)
+            return
+        
+        self._low = array[0].item() // 8 * 8  # byte-aligned, so bitmaps combine bytewise
+        mask = np.zeros(array[-1].item() - self._low + 1, dtype=bool)
+        mask[array - self._low] = True
+        self._bits = np.packbits(mask, bitorder='little')
+    
+    @classmethod
+    def _from_bits(cls, low: int, bits) -> 'BitmapSet':
+        result = cls.__new__(cls)
+        result._low, result._bits = low, bits
+        return result
+    
+    def _aligned(self, other) -> tuple:
+        """Return (low, self bytes, other bytes) padded to a common range"""
+        import numpy as np
+        
+        if not isinstance(other, BitmapSet):
+            other = BitmapSet(other)
+        if not self._bits.size or not other._bits.size:
+            low = other._low if not self._bits.size else self._low
+        else:
+            low = min(self._low, other._low)
+        high = max(self._low + 8 * self._bits.size, other._low + 8 * other._bits.size)
+        
+        def pad(bitmap):
+            out = np.zeros(max(0, (high - low) // 8), dtype=np.uint8)
+            if bitmap._bits.size:
+                start = (bitmap._low - low) // 8
+                out[start:start + bitmap._bits.size] = bitmap._bits
+            return out
+        
+        return low, pad(self), pad(other)
+    
+    def __or__(self, other) -> 'BitmapSet':
+        low, a, b = self._aligned(other)
+        return BitmapSet._from_bits(low, a | b)
+    
+    def __and__(self, other) -> 'BitmapSet':
+        low, a, b = self._aligned(other)
+        return BitmapSet._from_bits(low, a & b)
+    
+    def __sub__(self, other) -> 'BitmapSet':
+        low, a, b = self._aligned(other)
+        return BitmapSet._from_bits(low, a & ~b)
+    
+    def __xor__(self, other) -> 'BitmapSet':
+        low, a, b = self._aligned(other)
+        return BitmapSet._from_bits(low, a ^ b)
+    
+    def __contains__(self, value) -> bool:
+        offset = value - self._low
+        if offset < 0 or offset >= 8 * self._bits.size:
+            return False
+        return bool(self._bits[offset >> 3] >> (offset & 7) & 1)
+    
+    def __len__(self) -> int:
+        import numpy as np
+        return int(np.bitwise_count(self._bits).sum())
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_array().tolist())
+    
+    def __eq__(self, other) -> bool:
+        import numpy as np
+        if isinstance(other, (IntSet, BitmapSet, set, frozenset)):
+            other_values = other.to_array() if isinstance(other, (IntSet, BitmapSet)) else IntSet(other).to_array()
+            return np.array_equal(self.to_array(), other_values)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"BitmapSet(size={len(self)}, range=[{self._low}, {self._low + 8 * self._bits.size}))"
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bitmap"""
+        return self._bits.nbytes
+    
+    def to_array(self):
+        """Sorted int64 array of the elements"""
+        import numpy as np
+        return np.flatnonzero(np.unpackbits(self._bits, bitorder='little')).astype(np.int64) + self._low
+    
+    def to_set(self) -> set:
+        """Convert to a built-in set"""
+        return set(self.to_array().tolist())
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter (probabilistic set membership)
+    
+    May report an item as seen when it was not (at roughly error_rate
+    once `capacity` items were added), never the other way round.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        """
+        Size the filter
+        
+        Args:
+            capacity: Expected number of distinct items
+            error_rate: Target false-positive rate at capacity
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    @staticmethod
+    def _digest(item) -> int:
+        """
+        Stable 128-bit hash of item
+        
+        hash() is not usable here: hash(-1) == hash(-2), and ints that
+        differ by 2**61 - 1 collide. Equal ints, integral floats and bools
+        share an encoding, as they do in a set.
+        """
+        if isinstance(item, str):
+            data = b's' + item.encode('utf-8', 'surrogatepass')
+        elif isinstance(item, (bytes, bytearray)):
+            data = b'b' + bytes(item)
+        elif isinstance(item, int) or (isinstance(item, float) and item.is_integer()):
+            data = b'i' + str(int(item)).encode('ascii')
+        else:
+            data = b'r' + f"{type(item).__qualname__}:{item!r}".encode('utf-8', 'surrogatepass')
+        return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), 'little')
+    
+    def _positions(self, item) -> Iterator[int]:
+        """Bit positions of item (double hashing over a blake2b digest)"""
+        h = BloomFilter._digest(item)
+        h1, h2 = h & 0xFFFFFFFFFFFFFFFF, (h >> 64) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+    
+    def add(self, item) -> bool:
+        """
+        Add an item
+        
+        Returns:
+            True if the item was (probably) not in the filter before
+        """
+        new = False
+        for pos in self._positions(item):
+            byte, bit = pos >> 3, 1 << (pos & 7)
+            if not self._bits[byte] & bit:
+                self._bits[byte] |= bit
+                new = True
+        return new
+    
+    def __contains__(self, item) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class Deduplicator:
+    """Order-preserving streaming deduplicator
+    
+    'exact' keeps seen items in a set; once max_items is exceeded the set
+    is flushed to a SQLite table (an on-disk B-tree) and checked there
+    too. 'bloom' keeps a fixed-size BloomFilter and may drop a small
+    fraction of unique items.
+    """
+    
+    def __init__(self, mode: str = 'exact', max_items: int = None, spill_path: str = None,
+                 capacity: int = 1_000_000, error_rate: float = 0.01):
+        """
+        Create the deduplicator
+        
+        Args:
+            mode: 'exact' or 'bloom'
+            max_items: Items kept in memory before spilling ('exact' only,
+                       None for no limit); spilled items must be str, int,
+                       float or bytes
+            spill_path: SQLite file for spilled items (default: a
+                        temporary file)
+            capacity: Expected distinct items ('bloom' only)
+            error_rate: False-positive rate at capacity ('bloom' only)
+        """
+        if mode not in ('exact', 'bloom'):
+            raise ValueError(f"Unknown mode: {mode}")
+        self.mode = mode
+        self.max_items = max_items
+        self.spill_path = spill_path
+        self._seen = BloomFilter(capacity, error_rate) if mode == 'bloom' else set()
+        self._disk = None
+        self._temporary = False
+    
+    def add(self, item) -> bool:
+        """
+        Record an item
+        
+        Returns:
+            True if the item was not seen before
+        """
+        if self.mode == 'bloom':
+            return self._seen.add(item)
+        
+        if item in self._seen:
+            return False
+        if self._disk is not None and self._disk.execute(
+            "SELECT 1 FROM seen WHERE item = ?", (item,)
+        ).fetchone():
+            return False
+        
+        self._seen.add(item)
+        if self.max_items is not None and len(self._seen) > self.max_items:
+            self._spill()
+        return True
+    
+    def _spill(self) -> None:
+        """Move the in-memory set to the on-disk table"""
+        import sqlite3
+        
+        if self._disk is None:
+            if self.spill_path is None:
+                fd, self.spill_path = tempfile.mkstemp(suffix='.db')
+                os.close(fd)
+                self._temporary = True
+            self._disk = sqlite3.connect(self.spill_path)
+            self._disk.execute("CREATE TABLE IF NOT EXISTS seen (item PRIMARY KEY) WITHOUT ROWID")
+        with self._disk:
+            self._disk.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((i,) for i in self._seen))
+        self._seen.clear()
+    
+    def filter(self, items) -> Iterator:
+        """
+        Lazily yield the items not seen before, in input order
+        
+        Args:
+            items: Iterable of hashable items
+            
+        Yields:
+            Unique items
+        """
+        try:
+            for item in items:
+                if self.add(item):
+                    yield item
+        finally:
+            self.close()
+    
+    def close(self) -> None:
+        """Close the spill database, deleting it if it was a temporary file"""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+        if self._temporary:
+            os.remove(self.spill_path)
+            self._temporary = False
+
+
+class SalesAnalyzer:
+    """Analyze sales data"""
+    
+    @staticmethod
+    def get_sample_sales() -> list:
+        """Return sample sales data"""
+        return [
+            {'product': 'Laptop', 'price': 1200, 'quantity': 2},
+            {'product': 'Mouse', 'price': 25, 'quantity': 5},
+            {'product': 'Keyboard', 'price': 75, 'quantity': 3},
+        ]
+    
+    @staticmethod
+    def calculate_sale_total(sale: dict) -> float:
+        """Calculate total for a single sale"""
+        return sale['price'] * sale['quantity']
+    
+    @staticmethod
+    def analyze_sales(sales: list) -> dict:
+        """
+        Analyze all sales data
+        
+        Args:
+            sales: List of sale dictionaries, or a SalesTable
+            
+        Returns:
+            Analysis results
+        """
+        if isinstance(sales, SalesTable):
+            return SalesAnalyzer.analyze_sales_columnar(*sales.columns())
+        
+        totals = [SalesAnalyzer.calculate_sale_total(s) for s in sales]
+        
+        return {
+            'individual_totals': totals,
+            'total_revenue': sum(totals),
+            'total_products': sum([s['quantity'] for s in sales]),
+            'average_sale': sum(totals) / len(totals) if totals else 0
+        }
+    
+    @staticmethod
+    def analyze_sales_columnar(prices, quantities) -> dict:
+        """
+        Analyze sales data stored as columns (vectorized with NumPy)
+        
+        Args:
+            prices: Array-like of sale prices
+            quantities: Array-like of sale quantities (same length as prices)
+            
+        Returns:
+            Analysis results (same keys and types as analyze_sales)
+        """
+        import numpy as np
+        
+        prices = np.asarray(prices)
+        quantities = np.asarray(quantities)
+        if prices.shape != quantities.shape:
+            raise ValueError("prices and quantities must have the same length")
+        
+        if prices.size == 0:
+            return {
+                'individual_totals': [],
+                'total_revenue': 0,
+                'total_products': 0,
+                'average_sale': 0
+            }
+        
+        if np.issubdtype(prices.dtype, np.integer) and np.issubdtype(quantities.dtype, np.integer):
+            # Integer sums must stay exact like the dict version: use int64
+            # only when no product or sum can overflow, else Python ints
+            price_max = max(int(prices.max()), -int(prices.min()))
+            quantity_max = max(int(quantities.max()), -int(quantities.min()))
+            bound = max(price_max, 1) * quantity_max * prices.size
+            dtype = np.int64 if bound < 2 ** 63 and price_max < 2 ** 63 else object
+            prices, quantities = prices.astype(dtype), quantities.astype(dtype)
+        
+        totals = prices * quantities
+        # NumPy scalars -> Python numbers (object sums already are)
+        total_revenue, total_products = (
+            x.item() if isinstance(x, np.generic) else x
+            for x in (totals.sum(), quantities.sum())
+        )
+        
+        return {
+            'individual_totals': totals.tolist(),
+            'total_revenue': total_revenue,
+            'total_products': total_products,
+            'average_sale': total_revenue / totals.size
+        }
+    
+    @staticmethod
+    def analyze_sales_dataframe(df) -> dict:
+        """
+        Analyze sales data stored in a pandas DataFrame
+        
+        Args:
+            df: DataFrame with 'price' and 'quantity' columns
+            
+        Returns:
+            Analysis results (same keys and types as analyze_sales)
+        """
+        return SalesAnalyzer.analyze_sales_columnar(
+            df['price'].to_numpy(),
+            df['quantity'].to_numpy()
+        )
+    
+    @staticmethod
+    def group_by(sales, key='product') -> dict:
+        """
+        Aggregate sales per group in a single pass
+        
+        SalesTable (grouped by product) and pandas DataFrame inputs take a
+        vectorized path; other iterables are aggregated with one dict.
+        
+        Args:
+            sales: List of sale dictionaries, a SalesTable or a DataFrame
+            key: Field name to group by, or a callable taking a sale
+                 (for DataFrames it gets each row as a Series, so
+                 `lambda sale: sale['product']` works for every input)
+            
+        Returns:
+            Dictionary of group -> {'revenue', 'quantity', 'count', 'average'},
+            groups in order of first appearance
+        """
+        if isinstance(sales, SalesTable) and key == 'product':
+            return SalesAnalyzer._group_table(sales)
+        if hasattr(sales, 'groupby'):
+            return SalesAnalyzer._group_dataframe(sales, key)
+        
+        get_key = key if callable(key) else (lambda sale: sale[key])
+        groups = {}
+        
+        for sale in sales:
+            name = get_key(sale)
+            group = groups.get(name)
+            if group is None:
+                group = groups[name] = {'revenue': 0, 'quantity': 0, 'count': 0}
+            group['revenue'] += SalesAnalyzer.calculate_sale_total(sale)
+            group['quantity'] += sale['quantity']
+            group['count'] += 1
+        
+        return SalesAnalyzer._with_averages(groups)
+    
+    @staticmethod
+    def merge_groups(*partials: dict) -> dict:
+        """
+        Combine group_by results computed on separate chunks or processes
+        
+        Args:
+            *partials: Results of group_by
+            
+        Returns:
+            Merged group_by result
+        """
+        merged = {}
+        for partial in partials:
+            for name, stats in partial.items():
+                group = merged.setdefault(name, {'revenue': 0, 'quantity': 0, 'count': 0})
+                group['revenue'] += stats['revenue']
+                group['quantity'] += stats['quantity']
+                group['count'] += stats['count']
+        
+        return SalesAnalyzer._with_averages(merged)
+    
+    @staticmethod
+    def _with_averages(groups: dict) -> dict:
+        """Add the average sale to every group"""
+        for group in groups.values():
+            group['average'] = group['revenue'] / group['count'] if group['count'] else 0
+        return groups
+    
+    @staticmethod
+    def _group_table(table: 'SalesTable') -> dict:
+        """Group a SalesTable by product code with numpy.bincount"""
+        import numpy as np
+        
+        prices, quantities = table.columns()
+        codes = np.frombuffer(table.product_codes, dtype=np.uint32)
+        size = len(table.product_names)
+        
+        revenue = np.bincount(codes, weights=prices * quantities, minlength=size)
+        quantity = np.bincount(codes, weights=quantities, minlength=size)
+        count = np.bincount(codes, minlength=size)
+        
+        groups = {
+            name: {'revenue': revenue[i].item(), 'quantity': int(quantity[i]), 'count': count[i].item()}
+            for i, name in enumerate(table.product_names)
+            if count[i]
+        }
+        return SalesAnalyzer._with_averages(groups)
+    
+    @staticmethod
+    def _group_dataframe(df, key) -> dict:
+        """Group a DataFrame with pandas groupby"""
+        if callable(key):
+            # groupby(callable) would apply it to index labels, not rows
+            key = df.apply(key, axis=1) if len(df) else []
+        elif key not in df.columns:
+            raise ValueError(f"DataFrame has no column {key!r} to group by")
+        
+        grouped = (
+            df.assign(revenue=df['price'] * df['quantity'])
+            .groupby(key, sort=False)
+            .agg(revenue=('revenue', 'sum'), quantity=('quantity', 'sum'), count=('quantity', 'size'))
+        )
+        groups = {
+            name: {'revenue': row.revenue, 'quantity': row.quantity, 'count': row.count}
+            for name, row in zip(grouped.index.tolist(), grouped.itertuples(index=False))
+        }
+        return SalesAnalyzer._with_averages(groups)
+    
+    @staticmethod
+    def read_sales(path) -> Iterator[dict]:
+        """
+        Lazily read sale records from a CSV or JSONL file
+        
+        Args:
+            path: Path to a .csv file (with product, price, quantity
+                  header) or a .jsonl file (one sale object per line)
+            
+        Yields:
+            Sale dictionaries, one at a time
+        """
+        path = Path(path)
+        
+        with path.open(newline='', encoding='utf-8') as f:
+            if path.suffix.lower() == '.csv':
+                for row in csv.DictReader(f):
+                    yield {
+                        'product': row['product'],
+                        'price': float(row['price']),
+                        'quantity': int(row['quantity'])
+                    }
+            else:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+    
+    @staticmethod
+    def analyze_sales_stream(sales, chunk_size: int = 10_000, sink=None) -> dict:
+        """
+        Analyze sales with constant memory, one chunk at a time
+        
+        Args:
+            sales: Iterable of sale dictionaries, or a path to a
+                   CSV/JSONL file (see read_sales)
+            chunk_size: Number of sales processed per chunk
+            sink: Optional callable receiving each chunk's list of
+                  individual totals (e.g. list.extend or a file writer)
+            
+        Returns:
+            Running totals (no individual_totals, they go to sink)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if isinstance(sales, (str, Path)):
+            sales = SalesAnalyzer.read_sales(sales)
+        
+        rows = iter(sales)
+        total_revenue = 0
+        total_products = 0
+        sale_count = 0
+        
+        while chunk := list(islice(rows, chunk_size)):
+            analysis = SalesAnalyzer.analyze_sales(chunk)
+            total_revenue += analysis['total_revenue']
+            total_products += analysis['total_products']
+            sale_count += len(chunk)
+            if sink is not None:
+                sink(analysis['individual_totals'])
+        
+        return {
+            'total_revenue': total_revenue,
+            'total_products': total_products,
+            'sale_count': sale_count,
+            'average_sale': total_revenue / sale_count if sale_count else 0
+        }
+    
+    @staticmethod
+    def analyze_sales_parallel(sales, workers: int = None, partitions: int = None) -> dict:
+        """
+        Analyze sales on several cores, one partition per task
+        
+        In-memory columns are placed in shared memory once, so workers
+        read their slice without any rows being pickled. Files are split
+        into byte ranges aligned to line boundaries and each worker
+        streams its own range. Each worker returns a small partial
+        (revenue, quantity, count) that is merged at the end.
+        
+        Args:
+            sales: SalesTable, (prices, quantities) tuple of arrays, or a
+                   path to a CSV/JSONL file (one record per line)
+            workers: Number of processes (default: os.cpu_count())
+            partitions: Number of partitions (default: workers)
+            
+        Returns:
+            Totals in the same shape as analyze_sales_stream
+        """
+        workers = workers or os.cpu_count() or 1
+        partitions = partitions or workers
+        if partitions < 1:
+            raise ValueError("partitions must be positive")
+        
+        if isinstance(sales, (str, Path)):
+            partials = SalesAnalyzer._run_file_partitions(str(sales), workers, partitions)
+        else:
+            columns = sales.columns() if isinstance(sales, SalesTable) else sales
+            partials = SalesAnalyzer._run_shared_partitions(columns, workers, partitions)
+        
+        total_revenue = sum(p[0] for p in partials)
+        total_products = sum(p[1] for p in partials)
+        sale_count = sum(p[2] for p in partials)
+        
+        return {
+            'total_revenue': total_revenue,
+            'total_products': total_products,
+            'sale_count': sale_count,
+            'average_sale': total_revenue / sale_count if sale_count else 0
+        }
+    
+    @staticmethod
+    def _run_shared_partitions(columns: tuple, workers: int, partitions: int) -> list:
+        """Copy columns into shared memory and aggregate slices in a process pool"""
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+        
+        import numpy as np
+        
+        prices, quantities = (np.ascontiguousarray(c) for c in columns)
+        if prices.shape != quantities.shape:
+            raise ValueError("prices and quantities must have the same length")
+        if prices.size == 0:
+            return []
+        
+        blocks = []
+        try:
+            specs = []
+            for column in (prices, quantities):
+                block = shared_memory.SharedMemory(create=True, size=column.nbytes)
+                blocks.append(block)
+                np.ndarray(column.shape, column.dtype, buffer=block.buf)[:] = column
+                specs.append((block.name, column.shape, column.dtype.str))
+            
+            bounds = np.linspace(0, prices.size, partitions + 1, dtype=np.int64).tolist()
+            tasks = [(specs, start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+            
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                return list(pool.map(SalesAnalyzer._partial_shared, tasks))
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+    
+    @staticmethod
+    def _partial_shared(task: tuple) -> tuple:
+        """Aggregate one slice of shared-memory columns (runs in a worker)"""
+        from multiprocessing import shared_memory
+        
+        import numpy as np
+        
+        specs, start, end = task
+        blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+        try:
+            prices, quantities = (
+                np.ndarray(shape, np.dtype(dtype), buffer=block.buf)[start:end]
+                for block, (_, shape, dtype) in zip(blocks, specs)
+            )
+            partial = ((prices * quantities).sum().item(), quantities.sum().item(), end - start)
+            del prices, quantities  # release the buffers before closing
+            return partial
+        finally:
+            for block in blocks:
+                block.close()
+    
+    @staticmethod
+    def _run_file_partitions(path: str, workers: int, partitions: int) -> list:
+        """Split a file into line-aligned byte ranges and aggregate them in a process pool"""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with open(path, 'rb') as f:
+            header = f.readline() if path.lower().endswith('.csv') else b''
+            data_start = len(header)
+            size = os.fstat(f.fileno()).st_size
+        
+        step = max(1, -(-(size - data_start) // partitions))
+        tasks = [
+            (path, header, start, min(start + step, size))
+            for start in range(data_start, size, step)
+        ]
+        if not tasks:
+            return []
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            return list(pool.map(SalesAnalyzer._partial_file, tasks))
+    
+    @staticmethod
+    def _partial_file(task: tuple) -> tuple:
+        """Aggregate the lines starting inside one byte range (runs in a worker)"""
+        path, header, start, end = task
+        fieldnames = next(csv.reader([header.decode('utf-8')])) if header else None
+        
+        def records():
+            with open(path, 'rb') as f:
+                # Start at the first line beginning at or after `start`
+                if start > 0:
+                    f.seek(start - 1)
+                    f.readline()
+                while f.tell() < end:
+                    line = f.readline()
+                    if not line.strip():
+                        continue
+                    text = line.decode('utf-8')
+                    if fieldnames is None:
+                        yield json.loads(text)
+                    else:
+                        row = dict(zip(fieldnames, next(csv.reader([text]))))
+                        yield {
+                            'product': row['product'],
+                            'price': float(row['price']),
+                            'quantity': int(row['quantity'])
+                        }
+        
+        totals = SalesAnalyzer.analyze_sales_stream(records())
+        return totals['total_revenue'], totals['total_products'], totals['sale_count']
+
+
+class SaleRecord:
+    """Read-only view of one row of a SalesTable
+    
+    Supports sale['product'], sale['price'] and sale['quantity'], so it
+    can be passed anywhere a sale dictionary is expected.
+    """
+    
+    __slots__ = ('_table', '_index')
+    
+    def __init__(self, table: 'SalesTable', index: int):
+        self._table = table
+        self._index = index
+    
+    def __getitem__(self, field: str):
+        table, i = self._table, self._index
+        if field == 'price':
+            return table.prices[i]
+        if field == 'quantity':
+            return table.quantities[i]
+        if field == 'product':
+            return table.product_names[table.product_codes[i]]
+        raise KeyError(field)
+    
+    def __repr__(self) -> str:
+        return f"SaleRecord(product={self['product']!r}, price={self['price']}, quantity={self['quantity']})"
+
+
+class SalesTable:
+    """Compact struct-of-arrays container for sales
+    
+    Prices are stored in array('d'), quantities in array('q') and product
+    names as interned integer codes in array('I'), which takes about 20
+    bytes per row instead of a few hundred for a sale dictionary.
+    """
+    
+    def __init__(self, sales=None):
+        """
+        Create the table
+        
+        Args:
+            sales: Optional iterable of sale dictionaries to load
+        """
+        self.prices = array('d')
+        self.quantities = array('q')
+        self.product_codes = array('I')
+        self.product_names = []
+        self._codes = {}
+        if sales is not None:
+            self.extend(sales)
+    
+    def append(self, product: str, price: float, quantity: int) -> None:
+        """Add one sale"""
+        code = self._codes.get(product)
+        if code is None:
+            code = self._codes[product] = len(self.product_names)
+            self.product_names.append(product)
+        self.product_codes.append(code)
+        self.prices.append(price)
+        self.quantities.append(quantity)
+    
+    def extend(self, sales) -> None:
+        """Add many sale dictionaries"""
+        for sale in sales:
+            self.append(sale['product'], sale['price'], sale['quantity'])
+    
+    def __len__(self) -> int:
+        return len(self.prices)
+    
+    def __getitem__(self, index: int) -> SaleRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sale index out of range")
+        return SaleRecord(self, index)
+    
+    def __iter__(self) -> Iterator[SaleRecord]:
+        for i in range(len(self)):
+            yield SaleRecord(self, i)
+    
+    def columns(self) -> tuple:
+        """
+        Expose the price and quantity columns as NumPy arrays
+        
+        The table cannot grow (append/extend) while these views are alive.
+        
+        Returns:
+            Tuple (prices, quantities) of zero-copy array views
+        """
+        import numpy as np
+        
+        return (
+            np.frombuffer(self.prices, dtype=np.float64),
+            np.frombuffer(self.quantities, dtype=np.int64)
+        )
+
+
+class WordAnalyzer:
+    """Analyze words and letter frequency"""
+    
+    @staticmethod
+    def count_letters(words: list) -> dict:
+        """
+        Count letter frequency in words
+        
+        Args:
+            words: List of words to analyze
+            
+        Returns:
+            Dictionary with letter counts
+        """
+        text = ''.join(words).lower()
+        count = {}
+        
+        for letter in text:
+            count[letter] = count.get(letter, 0) + 1
+        
+        return count
+    
+    @staticmethod
+    def _count_shard(words: list) -> Counter:
+        """Count letters in one shard of words (runs in a worker process)"""
+        return Counter(''.join(words).lower())
+    
+    @staticmethod
+    def count_letters_parallel(words: list, workers: int = None,
+                               shard_size: int = 100_000) -> dict:
+        """
+        Count letter frequency using a pool of worker processes
+        
+        Args:
+            words: List of words to analyze
+            workers: Number of processes (default: os.cpu_count())
+            shard_size: Number of words sent to each worker task
+            
+        Returns:
+            Dictionary with letter counts (same as count_letters)
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        if shard_size < 1:
+            raise ValueError("shard_size must be positive")
+        
+        workers = workers or os.cpu_count() or 1
+        shards = [words[i:i + shard_size] for i in range(0, len(words), shard_size)]
+        
+        if workers == 1 or len(shards) <= 1:
+            return dict(WordAnalyzer._count_shard(words))
+        
+        count = Counter()
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            for partial in pool.map(WordAnalyzer._count_shard, shards):
+                count.update(partial)
+        
+        return dict(count)
+    
+    @staticmethod
+    def get_top_letters(words: list, top_n: int = 5) -> list:
+        """
+        Get most common letters
+        
+        Args:
+            words: List of words
+            top_n: Number of top letters to return
+            
+        Returns:
+            List of tuples (letter, count)
+        """
+        count = WordAnalyzer.count_letters(words)
+        return WordAnalyzer.top_from_count(count, top_n)
+    
+    @staticmethod
+    def top_from_count(count: dict, top_n: int = 5) -> list:
+        """
+        Pick the most common letters from an existing count
+        
+        Args:
+            count: Dictionary with letter counts
+            top_n: Number of top letters to return
+            
+        Returns:
+            List of tuples (letter, count), ties kept in insertion order
+        """
+        return heapq.nlargest(top_n, count.items(), key=lambda x: x[1])
+    
+    @staticmethod
+    def analyze(words: list) -> dict:
+        """
+        Complete word analysis
+        
+        Args:
+            words: List of words
+            
+        Returns:
+            Complete analysis dictionary
+        """
+        count = WordAnalyzer.count_letters(words)
+        
+        return {
+            'total_letters': sum(len(word) for word in words),
+            'unique_letters': len(count),
+            'letter_count': count,
+            'top_5': WordAnalyzer.top_from_count(count, 5)
+        }
+    
+    @staticmethod
+    def count_letters_file(path, chunk_size: int = 1 << 22,
+                           encoding: str = 'utf-8') -> dict:
+        """
+        Count letter frequency in a text file through a memory map
+        
+        Whitespace separates words and is not counted, so the result
+        matches count_letters(open(path).read().split()), whatever the
+        chunk_size. ASCII text is counted straight from the mapped bytes;
+        from the first chunk holding a non-ASCII byte on, the rest is
+        decoded one chunk at a time.
+        
+        Args:
+            path: Path to the text file
+            chunk_size: Number of bytes processed per step
+            encoding: Text encoding used for non-ASCII files
+            
+        Returns:
+            Dictionary with letter counts
+        """
+        return WordAnalyzer._scan_file(path, chunk_size, encoding)[0]
+    
+    @staticmethod
+    def analyze_file(path, chunk_size: int = 1 << 22,
+                     encoding: str = 'utf-8') -> dict:
+        """
+        Complete word analysis of a text file (same shape as analyze)
+        
+        Args:
+            path: Path to the text file
+            chunk_size: Number of bytes processed per step
+            encoding: Text encoding used for non-ASCII files
+            
+        Returns:
+            Complete analysis dictionary
+        """
+        count, total = WordAnalyzer._scan_file(path, chunk_size, encoding)
+        
+        return {
+            'total_letters': total,
+            'unique_letters': len(count),
+            'letter_count': count,
+            'top_5': WordAnalyzer.top_from_count(count, 5)
+        }
+    
+    @staticmethod
+    def _scan_file(path, chunk_size: int, encoding: str) -> tuple:
+        """Return (letter counts, total letters) for a memory-mapped file"""
+        import numpy as np
+        
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}, 0
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = np.frombuffer(mm, dtype=np.uint8)
+                byte_count = np.zeros(256, dtype=np.int64)
+                first_seen = np.full(256, data.size, dtype=np.int64)
+                ascii_end = data.size
+                for start in range(0, data.size, chunk_size):
+                    chunk = data[start:start + chunk_size]
+                    chunk_count = np.bincount(chunk, minlength=256)
+                    if chunk_count[128:].any():
+                        ascii_end = start  # decode from here on
+                        break
+                    new = np.flatnonzero((chunk_count > 0) & (byte_count == 0))
+                    if new.size:
+                        WordAnalyzer._locate_first(chunk, start, new, first_seen)
+                    byte_count += chunk_count
+                
+                # Last non-whitespace character already counted, kept as
+                # lowercasing context for the decoded part
+                context_start = ascii_end
+                while context_start > 0 and chr(data[context_start - 1]).isspace():
+                    context_start -= 1
+                context = chr(data[context_start - 1]) if context_start else ''
+                del data, chunk  # release the buffer export before the map closes
+                
+                count = WordAnalyzer._fold_ascii(byte_count, first_seen)
+                total = sum(count.values())
+                if ascii_end < len(mm):
+                    return WordAnalyzer._scan_decoded(
+                        mm, ascii_end, chunk_size, encoding, count, total, context
+                    )
+                return count, total
+    
+    @staticmethod
+    def _fold_ascii(byte_count, first_seen) -> dict:
+        """Letter counts from ASCII byte counts, lowercased, in first-occurrence order"""
+        import numpy as np
+        
+        # Lowercase by folding A-Z counts into a-z
+        upper, lower = slice(ord('A'), ord('Z') + 1), slice(ord('a'), ord('z') + 1)
+        byte_count[lower] += byte_count[upper]
+        byte_count[upper] = 0
+        np.minimum(first_seen[lower], first_seen[upper], out=first_seen[lower])
+        
+        # Same key order as count_letters: first occurrence in the text
+        return {
+            chr(b): int(byte_count[b])
+            for b in np.argsort(first_seen[:128], kind='stable').tolist()
+            if byte_count[b] and not chr(b).isspace()
+        }
+    
+    @staticmethod
+    def _locate_first(chunk, offset: int, values, first_seen) -> None:
+        """
+        Record in first_seen (array or dict) where each value in `values`
+        (bytes or code points) first occurs in chunk
+        """
+        import numpy as np
+        
+        # Scan small windows so each lookup touches only the items before the hit
+        window_size = 1 << 16
+        minlength = int(values.max()) + 1
+        for start in range(0, chunk.size, window_size):
+            window = chunk[start:start + window_size]
+            present = np.bincount(window, minlength=minlength)[values] > 0
+            for b in values[present].tolist():
+                first_seen[b] = offset + start + int(np.argmax(window == b))
+            values = values[~present]
+            if not values.size:
+                return
+    
+    @staticmethod
+    def _scan_decoded(mm: mmap.mmap, start: int, chunk_size: int, encoding: str,
+                      count: dict, total: int, context: str = '') -> tuple:
+        """
+        Count a mapped file from byte `start` on by decoding it chunk by chunk
+        
+        Each chunk's words are joined and lowercased together, as in
+        count_letters. Only a capital sigma lowercases by context (to ς at
+        the end of a word run), so when a chunk contains one, the text
+        after its last cased letter waits for the next chunk, and the last
+        few counted characters are kept as context. Characters are
+        counted with bincount over their code points.
+        """
+        import numpy as np
+        
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = ''
+        
+        with memoryview(mm) as view:
+            for pos in range(start, len(mm), chunk_size):
+                final = pos + chunk_size >= len(mm)
+                decoded = decoder.decode(view[pos:pos + chunk_size], final=final)
+                text = context + pending + ''.join(decoded.split())
+                cut = len(text)
+                # (pending is capped, in case a long run has no cased letter)
+                if not final and 'Σ' in text and len(pending) < max(4 * chunk_size, 1 << 16):
+                    cut = WordAnalyzer._sigma_safe_cut(text, len(context))
+                
+                lowered = text[:cut].lower()[len(context.lower()):]
+                codes = np.frombuffer(lowered.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+                if codes.size:
+                    chunk_count = np.bincount(codes)
+                    present = np.flatnonzero(chunk_count)
+                    new = np.array([c for c in present.tolist() if chr(c) not in count], dtype=np.int64)
+                    if new.size:
+                        # Insert new letters in first-occurrence order, as count_letters does
+                        first_seen = {}
+                        WordAnalyzer._locate_first(codes, 0, new, first_seen)
+                        for c in sorted(first_seen, key=first_seen.get):
+                            count[chr(c)] = 0
+                    for c, n in zip(present.tolist(), chunk_count[present].tolist()):
+                        count[chr(c)] += n
+                total += cut - len(context)
+                context, pending = text[max(0, cut - 16):cut], text[cut:]
+        
+        return count, total
+    
+    @staticmethod
+    def _sigma_safe_cut(text: str, start: int) -> int:
+        """Index just after the last cased non-Σ character of text[start:] (start if none)"""
+        for k in range(len(text) - 1, start - 1, -1):
+            c = text[k]
+            if c != 'Σ' and c.lower() != c.upper():
+                return k + 1
+        return start
+
+
+class LetterCounter:
+    """Incremental letter counter for a live stream of words"""
+    
+    def __init__(self, words: list = None):
+        """
+        Create a counter, optionally seeded with words
+        
+        Args:
+            words: Initial list of words
+        """
+        self._count = Counter()
+        self.total_letters = 0
+        if words:
+            self.add(words)
+    
+    def add(self, words: list) -> None:
+        """
+        Count new words without recounting previous ones
+        
+        Args:
+            words: List of words to add
+        """
+        for word in words:
+            self._count.update(word.lower())
+            self.total_letters += len(word)
+    
+    def count_letters(self) -> dict:
+        """Return letter counts seen so far"""
+        return dict(self._count)
+    
+    def top(self, top_n: int = 5) -> list:
+        """
+        Get most common letters seen so far
+        
+        Args:
+            top_n: Number of top letters to return
+            
+        Returns:
+            List of tuples (letter, count)
+        """
+        return WordAnalyzer.top_from_count(self._count, top_n)
+    
+    def analyze(self) -> dict:
+        """Complete analysis of all words seen so far (same as WordAnalyzer.analyze)"""
+        return {
+            'total_letters': self.total_letters,
+            'unique_letters': len(self._count),
+            'letter_count': self.count_letters(),
+            'top_5': self.top(5)
+        }
@@ -0,0 +1,261 @@
+"""
+Model: Instrumentation
+Opt-in call counts, latency percentiles and allocation peaks for every
+public model method
+
+Nothing is wrapped until enable() is called, and disable() puts the
+original methods back, so there is no overhead while disabled.
+
+Usage:
+    from models import instrumentation
+    instrumentation.enable(track_memory=True)
+    ...
+    print(instrumentation.to_json())
+    instrumentation.serve(port=9108)  # Prometheus text at /metrics
+"""
+
+import functools
+import importlib
+import inspect
+import json
+import threading
+import time
+import tracemalloc
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Submodules whose classes are instrumented
+MODEL_MODULES = ('python_basics', 'controls_flow', 'data_structures')
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float('inf'))
+
+# Latency samples kept per method for percentiles
+SAMPLE_SIZE = 10_000
+
+_lock = threading.Lock()
+# tracemalloc's peak counter is process-wide: calls measured with it run
+# one at a time (re-entrant, so nested model calls still work)
+_memory_lock = threading.RLock()
+_stats = {}
+_originals = []  # (class, attribute name, original descriptor)
+_track_memory = False
+_started_tracing = False  # whether enable() started tracemalloc itself
+
+
+class MethodStats:
+    """Counters for one instrumented method"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+        self.peak_alloc_bytes = 0
+    
+    def record(self, seconds: float, alloc_bytes: int) -> None:
+        """Add one call"""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.samples.append(seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        self.peak_alloc_bytes = max(self.peak_alloc_bytes, alloc_bytes)
+    
+    def summary(self) -> dict:
+        """Return counters and p50/p95/p99 latency (seconds)"""
+        ordered = sorted(self.samples)
+        
+        def percentile(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+        
+        return {
+            'calls': self.calls,
+            'total_seconds': self.total_seconds,
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'p99': percentile(0.99),
+            'peak_alloc_bytes': self.peak_alloc_bytes
+        }
+
+
+def _wrap(name: str, func):
+    """Time (and optionally trace allocations of) every call to func"""
+    def record(elapsed: float, alloc: int) -> None:
+        with _lock:
+            stats = _stats.get(name)
+            if stats is None:
+                stats = _stats[name] = MethodStats()
+            stats.record(elapsed, alloc)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not (_track_memory and tracemalloc.is_tracing()):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(time.perf_counter() - start, 0)
+        
+        with _memory_lock:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                record(elapsed, max(0, tracemalloc.get_traced_memory()[1] - before))
+    
+    return wrapper
+
+
+def _model_classes() -> list:
+    """Classes defined in the model submodules"""
+    classes = []
+    for module_name in MODEL_MODULES:
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        classes.extend(
+            cls for _, cls in inspect.getmembers(module, inspect.isclass)
+            if cls.__module__ == module.__name__
+        )
+    return classes
+
+
+def enable(track_memory: bool = False) -> None:
+    """
+    Start instrumenting every public model method
+    
+    Generator methods (e.g. FizzBuzz.stream) are skipped: calling one
+    only creates the generator, so its timing would be meaningless.
+    
+    Args:
+        track_memory: Also record the tracemalloc peak allocation of each
+                      call. Slower: tracked calls from different threads
+                      run one at a time, since the peak counter is
+                      process-wide; a nested call resets its caller's
+                      peak, and allocations by threads outside the model
+                      are still counted
+    """
+    global _track_memory, _started_tracing
+    
+    with _lock:
+        if _originals:
+            return
+        _track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        
+        for cls in _model_classes():
+            for attr, value in list(vars(cls).items()):
+                if attr.startswith('_'):
+                    continue
+                name = f"{cls.__name__}.{attr}"
+                if inspect.isgeneratorfunction(getattr(value, '__func__', value)):
+                    continue
+                if isinstance(value, staticmethod):
+                    wrapped = staticmethod(_wrap(name, value.__func__))
+                elif isinstance(value, classmethod):
+                    wrapped = classmethod(_wrap(name, value.__func__))
+                elif inspect.isfunction(value):
+                    wrapped = _wrap(name, value)
+                else:
+                    continue
+                _originals.append((cls, attr, value))
+                setattr(cls, attr, wrapped)
+
+
+def disable() -> None:
+    """Restore the original methods (collected statistics are kept)"""
+    global _track_memory, _started_tracing
+    
+    with _lock:
+        for cls, attr, value in reversed(_originals):
+            setattr(cls, attr, value)
+        _originals.clear()
+        if _started_tracing:
+            tracemalloc.stop()
+        _track_memory = False
+        _started_tracing = False
+
+
+def reset() -> None:
+    """Drop all collected statistics"""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot() -> dict:
+    """Return per-method statistics, keyed by 'Class.method'"""
+    with _lock:
+        return {name: stats.summary() for name, stats in sorted(_stats.items())}
+
+
+def to_json(indent: int = 2) -> str:
+    """Export the snapshot as JSON"""
+    return json.dumps(snapshot(), indent=indent)
+
+
+def to_prometheus() -> str:
+    """Export the statistics in the Prometheus text exposition format"""
+    lines = [
+        "# HELP models_call_duration_seconds Wall time of model method calls",
+        "# TYPE models_call_duration_seconds histogram",
+    ]
+    with _lock:
+        items = sorted(_stats.items())
+        for name, stats in items:
+            cumulative = 0
+            for bound, count in zip(BUCKETS, stats.buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'models_call_duration_seconds_bucket{{method="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'models_call_duration_seconds_sum{{method="{name}"}} {stats.total_seconds}')
+            lines.append(f'models_call_duration_seconds_count{{method="{name}"}} {stats.calls}')
+        
+        lines.append("# HELP models_call_peak_alloc_bytes Largest tracemalloc peak of a single call")
+        lines.append("# TYPE models_call_peak_alloc_bytes gauge")
+        for name, stats in items:
+            lines.append(f'models_call_peak_alloc_bytes{{method="{name}"}} {stats.peak_alloc_bytes}')
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serve /metrics (Prometheus) and /snapshot.json"""
+    
+    def do_GET(self):
+        if self.path == '/metrics':
+            body, content_type = to_prometheus(), 'text/plain; version=0.0.4'
+        elif self.path == '/snapshot.json':
+            body, content_type = to_json(), 'application/json'
+        else:
+            self.send_error(404)
+            return
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port: int = 9108, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """
+    Serve the metrics from a local HTTP endpoint in a daemon thread
+    
+    Args:
+        port: TCP port (0 picks a free one)
+        host: Interface to bind (local only by default)
+    
+    Returns:
+        The running server (call shutdown() to stop it)
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
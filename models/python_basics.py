@@ -3,9 +3,20 @@ Model: Python Basics Operations
 Contains business logic for Chapter 3 - numbers, strings, lists
 """
 
+import re
+from functools import partial
+
+# A word is a run of non-whitespace characters, as in str.split()
+_WORD = re.compile(r'\S+')
+
+
 class NumberOperations:
     """Handle number operations and calculations"""
     
+    # Keys returned by basic_operations, in order
+    OPERATIONS = ('sum', 'subtraction', 'multiplication', 'division',
+                  'integer_division', 'remainder', 'power')
+    
     @staticmethod
     def basic_operations(num1: float, num2: float) -> dict:
         """
@@ -28,6 +39,74 @@ class NumberOperations:
             'power': num1 ** num2
         }
     
+    @staticmethod
+    def basic_operations_array(num1, num2, operations: tuple = None) -> dict:
+        """
+        Perform basic arithmetic operations element-wise over arrays
+        
+        Division, integer division and remainder by zero give NaN
+        instead of raising. Integer powers are computed in int64 whatever
+        the input's integer width; those that would overflow int64 (or use
+        negative exponents) are computed in float64, giving inf on
+        overflow rather than wrapping around.
+        
+        Args:
+            num1: Array-like (or pandas Series) of first numbers
+            num2: Array-like (or pandas Series) of second numbers
+            operations: Keys of basic_operations to compute (default: all)
+            
+        Returns:
+            Dictionary with one result array per requested operation
+        """
+        import numpy as np
+        
+        a = np.asarray(num1)
+        b = np.asarray(num2)
+        operations = NumberOperations.OPERATIONS if operations is None else tuple(operations)
+        unknown = set(operations) - set(NumberOperations.OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operations: {sorted(unknown)}")
+        
+        shape = np.broadcast(a, b).shape
+        nonzero = b != 0
+        
+        def safe(ufunc):
+            out = np.full(shape, np.nan)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return ufunc(a, b, out=out, where=nonzero)
+        
+        results = {}
+        for op in operations:
+            if op == 'sum':
+                results[op] = a + b
+            elif op == 'subtraction':
+                results[op] = a - b
+            elif op == 'multiplication':
+                results[op] = a * b
+            elif op == 'division':
+                results[op] = safe(np.true_divide)
+            elif op == 'integer_division':
+                results[op] = safe(np.floor_divide)
+            elif op == 'remainder':
+                results[op] = safe(np.remainder)
+            elif op == 'power':
+                results[op] = NumberOperations._power_array(a, b)
+        return results
+    
+    @staticmethod
+    def _power_array(a, b):
+        """Element-wise power that never wraps around on integer overflow"""
+        import numpy as np
+        
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            approx = np.power(a.astype(np.float64), b.astype(np.float64))
+            if np.issubdtype(a.dtype, np.integer) and np.issubdtype(b.dtype, np.integer):
+                # Exact integer power only when every result safely fits in
+                # int64; computed in int64 so int8/int32 inputs do not wrap
+                if np.all(b >= 0) and np.all(np.abs(approx) < 2.0 ** 62):
+                    return np.power(a.astype(np.int64), b.astype(np.int64))
+            return approx
+    
     @staticmethod
     def get_examples() -> dict:
         """Return example number operations"""
@@ -43,6 +122,9 @@ class NumberOperations:
 class StringOperations:
     """Handle string operations and manipulations"""
     
+    # Cheap fields computed by analyze_fields when none are requested
+    DEFAULT_FIELDS = ('length', 'word_count', 'first_letter', 'last_letter')
+    
     @staticmethod
     def analyze_string(text: str) -> dict:
         """
@@ -54,17 +136,97 @@ class StringOperations:
         Returns:
             Dictionary with string properties
         """
+        words = text.split()
+        
         return {
             'original': text,
             'uppercase': text.upper(),
             'lowercase': text.lower(),
             'length': len(text),
-            'words': text.split(),
-            'word_count': len(text.split()),
+            'words': words,
+            'word_count': len(words),
             'first_letter': text[0] if text else '',
             'last_letter': text[-1] if text else ''
         }
     
+    @staticmethod
+    def analyze_fields(text: str, fields: tuple = DEFAULT_FIELDS) -> dict:
+        """
+        Analyze a string computing only the requested properties
+        
+        No copy of the text is made unless 'original', 'uppercase',
+        'lowercase' or 'words' is requested; word_count is counted by
+        scanning, without building the word list.
+        
+        Args:
+            text: Input string to analyze
+            fields: Keys of analyze_string to compute
+            
+        Returns:
+            Dictionary with the requested string properties
+        """
+        result = {}
+        for field in fields:
+            if field == 'length':
+                result[field] = len(text)
+            elif field == 'word_count':
+                result[field] = sum(1 for _ in _WORD.finditer(text))
+            elif field == 'first_letter':
+                result[field] = text[0] if text else ''
+            elif field == 'last_letter':
+                result[field] = text[-1] if text else ''
+            elif field == 'words':
+                result[field] = text.split()
+            elif field == 'uppercase':
+                result[field] = text.upper()
+            elif field == 'lowercase':
+                result[field] = text.lower()
+            elif field == 'original':
+                result[field] = text
+            else:
+                raise ValueError(f"Unknown field: {field}")
+        return result
+    
+    @staticmethod
+    def analyze_documents(documents, fields: tuple = DEFAULT_FIELDS,
+                          workers: int = None, chunksize: int = 256) -> list:
+        """
+        Analyze many documents in parallel
+        
+        Args:
+            documents: Iterable of strings
+            fields: Keys of analyze_string to compute
+            workers: Number of processes (default: os.cpu_count())
+            chunksize: Documents sent to a worker per task
+            
+        Returns:
+            List of result dictionaries, in input order
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        analyze = partial(StringOperations.analyze_fields, fields=tuple(fields))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(analyze, documents, chunksize=chunksize))
+    
+    @staticmethod
+    def analyze_file_lines(path: str, fields: tuple = DEFAULT_FIELDS,
+                           workers: int = None, chunksize: int = 1024) -> list:
+        """
+        Analyze every line of a text file in parallel
+        
+        Args:
+            path: Path to the text file
+            fields: Keys of analyze_string to compute
+            workers: Number of processes (default: os.cpu_count())
+            chunksize: Lines sent to a worker per task
+            
+        Returns:
+            List of result dictionaries, one per line
+        """
+        with open(path, encoding='utf-8') as f:
+            lines = (line.rstrip('\n') for line in f)
+            return StringOperations.analyze_documents(lines, fields, workers, chunksize)
+    
     @staticmethod
     def get_examples() -> dict:
         """Return example string operations"""
@@ -108,6 +270,56 @@ class ListOperations:
             'first_two': items[0:2] if len(items) >= 2 else items
         }
     
+    @staticmethod
+    def analyze_list_view(items, preview: int = 3) -> dict:
+        """
+        Analyze a list without copying or stringifying it
+        
+        'items' references the input through a SequenceView and
+        'first_two' is a view (NumPy slice or SequenceView),
+        so nothing is copied; both render only a preview of their
+        first and last `preview` elements.
+        
+        Args:
+            items: List, tuple, array.array, bytes or NumPy array
+            preview: Elements shown at each end when rendered
+            
+        Returns:
+            Dictionary with list properties
+        """
+        length = len(items)
+        
+        return {
+            'items': SequenceView(items, preview=preview),
+            'length': length,
+            'first': items[0] if length else None,
+            'last': items[-1] if length else None,
+            'first_two': ListOperations.slice_view(items, 0, 2, preview)
+        }
+    
+    @staticmethod
+    def slice_view(items, start: int, stop: int, preview: int = 3):
+        """
+        Slice a sequence without copying its elements
+        
+        Args:
+            items: Sequence to slice
+            start: First index
+            stop: End index (exclusive)
+            preview: Elements shown at each end when a SequenceView renders
+            
+        Returns:
+            NumPy view for arrays, SequenceView otherwise (over a
+            memoryview for buffer objects such as bytes and array.array)
+        """
+        if hasattr(items, '__array_interface__'):
+            return items[start:stop]
+        try:
+            items = memoryview(items)
+        except TypeError:
+            pass
+        return SequenceView(items, start, stop, preview)
+    
     @staticmethod
     def get_examples() -> dict:
         """Return example list operations"""
@@ -125,4 +337,62 @@ class ListOperations:
             'last_fruit': fruits[-1],
             'modified_fruits': fruits_modified,
             'first_two_numbers': numbers[0:2]
-        }
\ No newline at end of file
+        }
+
+
+class SequenceView:
+    """Lazy, read-only window onto a sequence
+    
+    Holds a reference to the sequence and a range instead of copying the
+    elements. str()/repr() only format the first and last `preview`
+    elements, so printing a view of a huge list stays cheap.
+    """
+    
+    def __init__(self, items, start: int = 0, stop: int = None, preview: int = 3):
+        """
+        Create the view
+        
+        Args:
+            items: Underlying sequence (not copied)
+            start: First index
+            stop: End index (exclusive, default: end of sequence)
+            preview: Elements shown at each end when rendered
+        """
+        self._items = items
+        self._range = range(len(items))[start:stop]
+        self.preview = preview
+    
+    def __len__(self) -> int:
+        return len(self._range)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = SequenceView(self._items, preview=self.preview)
+            view._range = self._range[index]
+            return view
+        return self._items[self._range[index]]
+    
+    def __iter__(self):
+        for i in self._range:
+            yield self._items[i]
+    
+    @staticmethod
+    def _format(item) -> str:
+        """repr() of an element, with NumPy scalars shown as plain Python values"""
+        if getattr(item, 'ndim', None) == 0 and hasattr(item, 'item'):
+            item = item.item()
+        return repr(item)
+    
+    def __repr__(self) -> str:
+        k = self.preview
+        if len(self) <= 2 * k:
+            shown = [SequenceView._format(item) for item in self]
+        else:
+            head = [SequenceView._format(self[i]) for i in range(k)]
+            tail = [SequenceView._format(self[i]) for i in range(len(self) - k, len(self))]
+            shown = head + ['...'] + tail
+        return f"[{', '.join(shown)}] ({len(self)} items)"
+    
+    def to_list(self) -> list:
+        """Copy the viewed elements into a new list"""
+        return list(self)
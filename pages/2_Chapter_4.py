@@ -2,6 +2,7 @@ import streamlit as st
 from models.controls_flow import (
     AgeClassifier,
     MultiplicationTable,
+    MultiplicationMatrix,
     HealthCalculator,
     FizzBuzz,
     ControlFlowExamples
@@ -9,6 +10,13 @@ from models.controls_flow import (
 
 st.set_page_config(page_title="Chapter 4 - Control Flow", page_icon="📄", layout="wide")
 
+
+@st.cache_resource
+def get_multiplication_matrix():
+    """Every table from 1 to 10,000 (multipliers up to 1,000), built once"""
+    return MultiplicationMatrix(10_000, 1_000)
+
+
 st.title("Chapter 4: More Control Flow Tools")
 
 st.markdown("""
@@ -180,15 +188,24 @@ with tab3:
     st.markdown("---")
     
     st.subheader("Exercise 2: Multiplication Table")
-    number = st.selectbox("Choose a number:", range(1, 11))
+    number = st.number_input("Choose a number:", min_value=1, max_value=10_000, value=1)
+    up_to = st.number_input("Up to:", min_value=1, max_value=1_000, value=10)
     
     if st.button("Show Table"):
-        # Use model to generate table
-        table = MultiplicationTable.format_table(number)
-        
         st.write(f"**Multiplication table of {number}:**")
-        for line in table:
-            st.write(line)
+        if up_to <= 10:
+            # Use model to generate table
+            for line in MultiplicationTable.format_table(number, up_to):
+                st.write(line)
+        else:
+            # Large tables: only format the rows shown, the rest is a zero-copy view
+            matrix = get_multiplication_matrix()
+            for line in matrix.format_table(number, stop=10):
+                st.write(line)
+            st.dataframe(
+                {"multiplier": range(1, up_to + 1), "result": matrix.row(number)[:up_to]},
+                hide_index=True
+            )
     
     st.markdown("---")
     
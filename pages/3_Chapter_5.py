@@ -11,6 +11,13 @@ from models.data_structures import (
 
 st.set_page_config(page_title="Chapter 5 - Data Structures", page_icon="📄", layout="wide")
 
+
+@st.cache_resource
+def get_shared_inventory():
+    """Process-wide inventory, created once and shared by all sessions"""
+    return InventoryManager.create_shared_inventory()
+
+
 st.title("Chapter 5: Data Structures")
 
 st.markdown("""
@@ -243,21 +250,30 @@ print(f"\\nTotal items: {total}")
     """, language="python")
     
     with st.expander("Interactive Version"):
-        # Initialize inventory in session state
-        if 'inventory' not in st.session_state:
-            st.session_state.inventory = InventoryManager.create_default_inventory()
+        # One inventory shared by every session (persisted in inventory.db)
+        st.session_state.inventory = get_shared_inventory()
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**Current Inventory:**")
-            # Use model to format inventory
-            for line in InventoryManager.format_inventory(st.session_state.inventory):
-                st.write(f"- {line}")
+            # Only format what changed since this session's last rerun
+            inventory = st.session_state.inventory
+            if 'inventory_lines' not in st.session_state:
+                st.session_state.inventory_lines = {}
+                st.session_state.inventory_version = 0
+            changes = inventory.changes_since(st.session_state.inventory_version)
+            st.session_state.inventory_version += len(changes)
+            lines = InventoryManager.update_formatted(st.session_state.inventory_lines, changes)
+            st.markdown("\n".join(f"- {line}" for line in lines.values()))
             
-            # Use model to calculate total
-            total = InventoryManager.get_total_items(st.session_state.inventory)
-            st.metric("Total", total)
+            # Running aggregates, kept up to date by the model
+            summary = inventory.get_summary()
+            st.metric("Total", summary['total_items'])
+            st.caption(
+                f"{summary['distinct_products']} products · "
+                f"stock {summary['min_stock']}–{summary['max_stock']}"
+            )
         
         with col2:
             new_product = st.text_input("Add product:")
@@ -0,0 +1,36 @@
+"""
+Tests: Result cache
+"""
+
+import json
+
+from models import ListComprehensions, MultiplicationTable, cached
+
+
+def test_cached_methods_keep_their_return_types():
+    table = MultiplicationTable.format_table(3, 4)
+    table.append('extra')
+    assert MultiplicationTable.format_table(3, 4) == ["3 × 1 = 3", "3 × 2 = 6", "3 × 3 = 9", "3 × 4 = 12"]
+    
+    examples = ListComprehensions.get_all_examples()
+    assert isinstance(examples, dict) and isinstance(examples['cubes'], list)
+    examples['cubes'].append(0)
+    json.dumps(examples)
+    assert ListComprehensions.get_all_examples()['cubes'][-1] == 1000
+
+
+def test_cache_keys_are_typed():
+    assert MultiplicationTable.format_table(2, 1) == ['2 × 1 = 2']
+    assert MultiplicationTable.format_table(2.0, 1) == ['2.0 × 1 = 2.0']
+
+
+def test_unhashable_arguments_bypass_cache():
+    class Unhashable:
+        __hash__ = None
+    
+    @cached()
+    def identity(value):
+        return value
+    
+    item = Unhashable()
+    assert identity([item]) == [item]
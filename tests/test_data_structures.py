@@ -0,0 +1,118 @@
+"""
+Tests: Data Structures model
+"""
+
+import threading
+
+from models import (
+    IntSet,
+    InventoryManager,
+    SalesAnalyzer,
+    SetOperations,
+    SharedInventory,
+    SQLiteInventory,
+    WordAnalyzer
+)
+
+
+def test_bloom_deduplicate_keeps_ints_sharing_hash():
+    # hash(-1) == hash(-2) in CPython
+    assert list(SetOperations.deduplicate(range(-5, 5), mode='bloom')) == list(range(-5, 5))
+
+
+def test_bloom_deduplicate_keeps_ints_differing_by_hash_modulus():
+    items = [1, 1 + 2**61 - 1, 2, 2 + 2**61 - 1]
+    assert list(SetOperations.deduplicate(items, mode='bloom')) == items
+
+
+def test_bloom_deduplicate_drops_repeats():
+    items = ['a', 'b', 'a', 3, 3.0, 'b']
+    assert list(SetOperations.deduplicate(items, mode='bloom')) == ['a', 'b', 3]
+
+
+def test_int_set_accepts_iterators():
+    assert IntSet(x for x in range(5)) == IntSet(range(5))
+    assert IntSet({3: 'a', 1: 'b'}.keys()) == IntSet([1, 3])
+    assert SetOperations.compact_set(x * 3 for x in range(5)).to_set() == {0, 3, 6, 9, 12}
+
+
+def test_analyze_file_matches_analyze(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text('Hello WORLD\n foo\x0bbar')
+    expected = WordAnalyzer.analyze(path.read_text().split())
+    assert WordAnalyzer.analyze_file(path) == expected
+    assert list(WordAnalyzer.analyze_file(path)['letter_count']) == list(expected['letter_count'])
+
+
+def test_analyze_file_non_ascii_matches_analyze_for_any_chunk_size(tmp_path):
+    path = tmp_path / 'greek.txt'
+    path.write_text('plain ascii first\n' + 'ΟΔΥΣΣΕΥΣ ΚΑΙ ΣΟΦΙΑ ação\n' * 100, encoding='utf-8')
+    expected = WordAnalyzer.analyze(path.read_text(encoding='utf-8').split())
+    for chunk_size in (1, 7, 64, 1 << 22):
+        result = WordAnalyzer.analyze_file(path, chunk_size=chunk_size)
+        assert result == expected
+        assert list(result['letter_count']) == list(expected['letter_count'])
+
+
+def _hammer(inventory, threads: int = 8, rounds: int = 2_000) -> list:
+    """Mixed writes and removals from several threads; returns raised errors"""
+    errors = []
+    
+    def worker(seed: int) -> None:
+        try:
+            for i in range(rounds):
+                product = f"p{(seed * 31 + i) % 50}"
+                if i % 3:
+                    InventoryManager.add_product(inventory, product, i % 10)
+                else:
+                    InventoryManager.remove_product(inventory, product)
+                    inventory.setdefault(product, 1)
+                    inventory.pop(product, None)
+        except Exception as error:
+            errors.append(error)
+    
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return errors
+
+
+def test_shared_inventory_concurrent_removals():
+    store = SQLiteInventory(':memory:')
+    inventory = SharedInventory(store=store)
+    assert _hammer(inventory) == []
+    inventory.close()
+    assert inventory.total_items == sum(inventory.values())
+    assert dict(store.items()) == dict(inventory.items())
+    
+    quantities = list(inventory.values())
+    assert inventory.get_summary() == {
+        'total_items': sum(quantities),
+        'distinct_products': len(quantities),
+        'min_stock': min(quantities, default=None),
+        'max_stock': max(quantities, default=None)
+    }
+    lines = InventoryManager.update_formatted({}, inventory.changes_since(0))
+    assert sorted(lines.values()) == sorted(InventoryManager.format_inventory(inventory))
+
+
+def test_sqlite_inventory_concurrent_removals():
+    inventory = SQLiteInventory(':memory:')
+    assert _hammer(inventory) == []
+    assert inventory.total_items == sum(inventory.values())
+    inventory.close()
+
+
+def test_columnar_sales_do_not_overflow():
+    sales = [{'product': 'Server', 'price': 2**40, 'quantity': 2**30}]
+    assert SalesAnalyzer.analyze_sales_columnar([2**40], [2**30]) == SalesAnalyzer.analyze_sales(sales)
+
+
+def test_group_by_callable_key_on_dataframe():
+    import pandas as pd
+    
+    sales = SalesAnalyzer.get_sample_sales()
+    first_letter = lambda sale: sale['product'][0]
+    assert SalesAnalyzer.group_by(pd.DataFrame(sales), first_letter) == SalesAnalyzer.group_by(sales, first_letter)
@@ -0,0 +1,26 @@
+"""
+Tests: Python Basics model
+"""
+
+import numpy as np
+import pandas as pd
+
+from models import NumberOperations
+
+
+def test_power_array_does_not_wrap_small_int_dtypes():
+    result = NumberOperations.basic_operations_array(
+        np.array([10], np.int32), np.array([10], np.int32), operations=['power']
+    )
+    assert result['power'].tolist() == [10 ** 10]
+    
+    result = NumberOperations.basic_operations_array(
+        np.array([5], np.int8), np.array([4], np.int8), operations=['power']
+    )
+    assert result['power'].tolist() == [625]
+
+
+def test_power_array_does_not_wrap_int32_series():
+    series = pd.Series([10, 3], dtype=np.int32)
+    result = NumberOperations.basic_operations_array(series, series, operations=['power'])
+    assert result['power'].tolist() == [10 ** 10, 27]